@@ -0,0 +1,37 @@
+"""Add trigram index on bible verse content
+
+Revision ID: ccfd53e3b392
+Revises: 5786a69aae71
+Create Date: 2026-10-15 22:40:12.418263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ccfd53e3b392'
+down_revision: Union[str, Sequence[str], None] = '5786a69aae71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    op.create_index(
+        'ix_bible_verses_content_trgm',
+        'bible_verses',
+        ['content'],
+        unique=False,
+        schema='public',
+        postgresql_using='gin',
+        postgresql_ops={'content': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bible_verses_content_trgm', table_name='bible_verses', schema='public', postgresql_using='gin')
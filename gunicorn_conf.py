@@ -7,13 +7,18 @@ import os
 
 # Server socket
 bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+# The kernel caps the listen queue at net.core.somaxconn, raise that sysctl in the
+# container before going beyond 2048 here
 backlog = 2048
+# SO_REUSEPORT on the arbiter's listening socket, which every worker inherits. It lets a
+# restarted or upgraded master bind the port while the old socket is still open
+reuse_port = True
 
 # Worker processes
 core_workers = multiprocessing.cpu_count()
 workers = int(os.getenv('GUNICORN_WORKERS', core_workers))
-worker_class = 'uvicorn.workers.UvicornWorker'
-worker_connections = 1000
+worker_class = 'portal.gunicorn_worker.UvloopWorker'
+worker_connections = 2000
 timeout = 120
 keepalive = 15
 
@@ -36,7 +41,8 @@ tmp_upload_dir = None
 
 # Worker timeout and graceful shutdown
 graceful_timeout = 150
-preload_app = True
+# Workers import the app themselves and warm their own caches and connection pools
+preload_app = False
 if os.path.isdir("/dev/shm"):
     worker_tmp_dir = "/dev/shm"  # nosec
 
@@ -2,6 +2,7 @@
 Admin sub application
 """
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from portal.container import Container
 from portal.libs.utils.lifespan import lifespan
@@ -19,6 +20,7 @@ def create_admin_app(container: Container) -> FastAPI:
         title="Rooted Portal Admin API",
         description="Admin API for Rooted Portal",
         version="1.0.0",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
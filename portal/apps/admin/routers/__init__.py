@@ -1,7 +1,12 @@
 """
 Admin routers package
 """
+import orjson
 from fastapi import FastAPI
+from fastapi.responses import Response
+
+# Static payload, serialized once at import
+_HEALTHZ_BODY = orjson.dumps({"message": "ok", "service": "admin"})
 
 
 def register_routers(app: FastAPI) -> None:
@@ -16,12 +21,9 @@ def register_routers(app: FastAPI) -> None:
     # app.include_router(auth_router, prefix="/api/v1/auth", tags=["Admin - Authentication"])
 
     # For now, create a simple health check endpoint
-    @app.get("/healthz")
+    @app.get("/healthz", response_class=Response)
     async def admin_healthz():
         """
         Admin healthcheck endpoint
         """
-        return {
-            "message": "ok",
-            "service": "admin"
-        }
+        return Response(content=_HEALTHZ_BODY, media_type="application/json")
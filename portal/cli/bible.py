@@ -2,44 +2,96 @@
 Bible crawler CLI commands.
 """
 
-import json
+import asyncio
+import concurrent.futures
+import functools
+import itertools
 import os
+import re
 import sqlite3
 import time
 from typing import Any
 
 import click
 import httpx
+import orjson
 from dotenv import load_dotenv
 
-from portal.libs.http_client import http_client
 from portal.libs.logger import logger
 
-# Load environment variables from .env file
-load_dotenv()
-
 BASE_URL = "https://api.youversion.com"
 YVP_APP_KEY_ENV = "YVP_APP_KEY"
 YVP_AUTH_HEADER = "X-YVP-App-Key"
+# Verses per SQLite transaction, state.json is checkpointed along with each of them
+INSERT_BATCH_SIZE = 1000
+
+INSERT_ROWS_PER_STATEMENT = 100
+# passages.{shard}.db / state.{shard}.json written by `--parallel-books` workers
+_SHARD_FILE_RE = re.compile(r"(?:passages\.(\d+)\.db|state\.(\d+)\.json)")
+# Pause until the rate limit window resets once this few requests are left
+RATE_LIMIT_LOW_WATERMARK = 2
+
+_INSERT_COLUMNS = (
+    "bible_id", "book_id", "chapter", "verse", "passage_id",
+    "format", "include_headings", "include_notes", "data", "created_at",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _insert_sql(rows: int) -> str:
+    """
+    Multi-row INSERT for `rows` verses, one sqlite3_step for the whole chunk.
+    Rows already on disk are kept as they are: no delete + reinsert, no index rewrite.
+    No conflict target, so both UNIQUE(passage_id) and UNIQUE(bible_id, book_id, chapter, verse) are covered.
+    """
+    row = "(" + ", ".join("?" * len(_INSERT_COLUMNS)) + ")"
+    return f"INSERT INTO verses ({', '.join(_INSERT_COLUMNS)}) VALUES {', '.join([row] * rows)} ON CONFLICT DO NOTHING"
 
 
 def load_json(path: str, default):
     if os.path.exists(path):
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     return default
 
 
-def atomic_write_json(path: str, obj: Any):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+def atomic_write_json(path: str, obj: Any, ensure_dir: bool = True):
+    if ensure_dir:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     os.replace(tmp, path)
 
 
+def _to_int(value: Any) -> Any:
+    """Integer if `value` is numeric, otherwise its string representation."""
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return str(value)
+
+
+class _SafeFilenameTable(dict):
+    """`str.translate` table for `safe_filename`, each character is classified once on first use."""
+
+    def __missing__(self, codepoint: int) -> str:
+        c = chr(codepoint)
+        self[codepoint] = value = c if c.isalnum() or c in "-_." else "_"
+        return value
+
+
+_SAFE_TABLE = _SafeFilenameTable()
+
+
 def safe_filename(s: str) -> str:
-    return "".join(c if c.isalnum() or c in ("-", "_", ".") else "_" for c in str(s))
+    return str(s).translate(_SAFE_TABLE)
+
+
+class _CrawlStopped(Exception):
+    """Carries a `SystemExit` raised by a passage task out of the event loop."""
 
 
 class YouVersionDumper:
@@ -53,7 +105,15 @@ class YouVersionDumper:
         include_headings: bool,
         include_notes: bool,
         format_: str,
+        concurrency: int = 8,
+        shard: int | None = None,
+        shards: int | None = None,
     ):
+        """
+        :param shard: Shard number of a `--parallel-books` worker, which writes to its own
+            passages.{shard}.db / state.{shard}.json (see `dump_passages_in_shards`)
+        :param shards: Number of shards the books are split into, recorded in the shard's state
+        """
         self.bible_id = str(bible_id)
         self.out_dir = out_dir
         self.daily_limit = daily_limit
@@ -62,6 +122,9 @@ class YouVersionDumper:
         self.include_headings = include_headings
         self.include_notes = include_notes
         self.format_ = format_
+        self.concurrency = max(1, concurrency)
+        self.shard = shard
+        self.shards = shards
         self.max_retries = 3  # Maximum retries for timeout/connection errors
         self.retry_interval = 5  # Seconds between retries
 
@@ -73,10 +136,31 @@ class YouVersionDumper:
         if yvp_app_key:
             self.headers[YVP_AUTH_HEADER] = yvp_app_key
 
+        # One pooled client for the whole crawl, so keep-alive connections are
+        # reused instead of paying a TCP + TLS handshake per passage
+        self._client = httpx.Client(
+            base_url=BASE_URL,
+            headers=self.headers,
+            timeout=self.timeout_sec,
+            limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60),
+        )
+
         self.root_dir = os.path.join(out_dir, self.bible_id)
-        self.state_path = os.path.join(self.root_dir, "state.json")
+        self.state_path = self._shard_path(self.root_dir, "state.json", shard)
         self.meta_dir = os.path.join(self.root_dir, "meta")
-        self.db_path = os.path.join(self.root_dir, "passages.db")
+        self.db_path = self._shard_path(self.root_dir, "passages.db", shard)
+        self._conn: sqlite3.Connection | None = None
+        self._rows_per_statement = 1
+        self._pending: list[tuple] = []
+        self._ts_sec = 0
+        self._ts_str = ""
+        self._state_dirty = False
+        # Set up by `_adump_passages` inside its event loop
+        self._aclient: httpx.AsyncClient | None = None
+        self._throttle_lock: asyncio.Lock | None = None
+        self._next_request_at = 0.0
+        # Rate limit headers of the latest successful response
+        self._rate: dict[str, Any] = {}
 
         self.state = load_json(
             self.state_path,
@@ -89,10 +173,12 @@ class YouVersionDumper:
                 "done": False,
                 "updated_at": None,
                 "rate_limit_info": None,
+                "shards": shards,
             },
         )
 
-        if str(self.state.get("bible_id")) != self.bible_id:
+        # A shard count change splits the books differently, the saved positions no longer apply
+        if str(self.state.get("bible_id")) != self.bible_id or self.state.get("shards") != shards:
             self.state = {
                 "bible_id": self.bible_id,
                 "requests_today": 0,
@@ -102,20 +188,89 @@ class YouVersionDumper:
                 "done": False,
                 "updated_at": None,
                 "rate_limit_info": None,
+                "shards": shards,
             }
 
+        # Output layout is fixed, create it once instead of on every write
+        # (meta_dir lives under root_dir, which holds state.json and passages.db)
+        os.makedirs(self.meta_dir, exist_ok=True)
+
         # Initialize SQLite database
-        self._init_database()
+        self._init_schema()
+
+        # Passages already on disk are never requested again, whatever state.json says
+        cursor = self._conn.execute("SELECT passage_id FROM verses WHERE bible_id = ?", (self.bible_id,))
+        self._have: set[str] = {row[0] for row in cursor}
+        if shard is not None:
+            # Verses merged into passages.db by earlier runs are no longer in the shard database
+            master_db = os.path.join(self.root_dir, "passages.db")
+            if os.path.exists(master_db):
+                master = sqlite3.connect(master_db)
+                try:
+                    cursor = master.execute("SELECT passage_id FROM verses WHERE bible_id = ?", (self.bible_id,))
+                    self._have.update(row[0] for row in cursor)
+                finally:
+                    master.close()
+
+    @staticmethod
+    def _shard_path(root_dir: str, filename: str, shard: int | None) -> str:
+        """passages.db -> passages.{shard}.db for shard workers."""
+        if shard is None:
+            return os.path.join(root_dir, filename)
+        stem, ext = os.path.splitext(filename)
+        return os.path.join(root_dir, f"{stem}.{shard}{ext}")
+
+    def _shard_numbers(self) -> list[int]:
+        """Shards with a database or state file on disk, left by this or any earlier sharded run."""
+        shards = set()
+        for filename in os.listdir(self.root_dir):
+            match = _SHARD_FILE_RE.fullmatch(filename)
+            if match:
+                shards.add(int(match.group(1) or match.group(2)))
+        return sorted(shards)
+
+    def _now_iso(self) -> str:
+        """Local ISO timestamp, formatted at most once per wall-clock second."""
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(now))
+        return self._ts_str
+
+    def _write_state(self):
+        self.state["updated_at"] = self._now_iso()
+        atomic_write_json(self.state_path, self.state, ensure_dir=False)
+        self._state_dirty = False
 
     def _save_state(self):
-        self.state["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
-        atomic_write_json(self.state_path, self.state)
+        """Flush queued verses and write state.json now, whatever the batch size."""
+        # Never let the checkpoint get ahead of the rows on disk
+        self._state_dirty = True
+        self._flush(force=True)
+        if self._state_dirty:
+            # Nothing was queued, so `_flush` didn't write it
+            self._write_state()
+
+    def _init_schema(self):
+        """
+        Initialize SQLite database with verses table.
+        """
+        # Autocommit mode: transactions are opened explicitly in `_flush`
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None)
+        # Stay under the bound-parameter cap of the linked SQLite (999 on old builds, 32766 since 3.32)
+        self._rows_per_statement = max(
+            1,
+            min(INSERT_ROWS_PER_STATEMENT, self._conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER) // len(_INSERT_COLUMNS)),
+        )
+        cursor = self._conn.cursor()
 
-    def _init_database(self):
-        """Initialize SQLite database with verses table."""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # WAL keeps readers unblocked while the dump is writing, and with
+        # synchronous=NORMAL a commit no longer pays two fsyncs
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
 
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS verses (
@@ -134,11 +289,10 @@ class YouVersionDumper:
             )
         """)
 
-        cursor.execute("""CREATE INDEX IF NOT EXISTS idx_passage_id ON verses(passage_id)""")
-        cursor.execute("""CREATE INDEX IF NOT EXISTS idx_book_chapter_verse ON verses(bible_id, book_id, chapter, verse)""")
-
-        conn.commit()
-        conn.close()
+        # UNIQUE(passage_id) and UNIQUE(bible_id, book_id, chapter, verse) already index
+        # both lookups, the old secondary indexes only duplicated them
+        cursor.execute("""DROP INDEX IF EXISTS idx_passage_id""")
+        cursor.execute("""DROP INDEX IF EXISTS idx_book_chapter_verse""")
 
     def _insert_verse(
         self,
@@ -146,53 +300,75 @@ class YouVersionDumper:
         chapter: Any,
         verse: Any,
         passage_id: str,
-        params: dict[str, Any],
+        params: tuple[Any, Any, Any],
         data: Any,
     ):
-        """Insert or replace a verse in the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Convert chapter and verse to integers if possible
-        try:
-            chapter_int = int(chapter) if str(chapter).isdigit() else None
-        except (ValueError, TypeError):
-            chapter_int = None
-
-        try:
-            verse_int = int(verse) if str(verse).isdigit() else None
-        except (ValueError, TypeError):
-            verse_int = None
-
-        # Use integer if available, otherwise use string representation
-        chapter_value = chapter_int if chapter_int is not None else str(chapter)
-        verse_value = verse_int if verse_int is not None else str(verse)
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO verses (
-                bible_id, book_id, chapter, verse, passage_id,
-                format, include_headings, include_notes, data, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        """
+        Queue a verse for the next batched insert (see `_flush`).
+        :param params: (format, include_headings, include_notes) as stored in the row
+        """
+        self._pending.append((
             self.bible_id,
             book_id,
-            chapter_value,
-            verse_value,
+            _to_int(chapter),
+            _to_int(verse),
             passage_id,
-            params.get("format"),
-            1 if params.get("include_headings") == "true" else 0,
-            1 if params.get("include_notes") == "true" else 0,
-            json.dumps(data, ensure_ascii=False),
-            time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            *params,
+            orjson.dumps(data).decode(),
+            self._now_iso(),
         ))
 
-        conn.commit()
-        conn.close()
+    def _flush(self, force: bool = False):
+        """
+        Write queued verses in a single transaction, followed by state.json if it changed.
+        Checkpoints only advance once a chapter's verses are all queued, so the saved state
+        never points past the rows on disk.
+        :param force: Flush even if the batch is not full yet
+        """
+        if not self._pending:
+            return
+        if not force and len(self._pending) < INSERT_BATCH_SIZE:
+            return
+
+        pending = self._pending
+        k = self._rows_per_statement
+        full = len(pending) - len(pending) % k
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            if full:
+                self._conn.executemany(
+                    _insert_sql(k),
+                    (tuple(itertools.chain.from_iterable(pending[i:i + k])) for i in range(0, full, k)),
+                )
+            if full < len(pending):
+                self._conn.execute(_insert_sql(len(pending) - full), tuple(itertools.chain.from_iterable(pending[full:])))
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        self._have.update(row[4] for row in pending)
+        self._pending.clear()
+        if self._state_dirty:
+            self._write_state()
+
+    def close(self):
+        """Flush queued verses and pending state and close the SQLite connection."""
+        if self._conn is None:
+            return
+        try:
+            if self._state_dirty:
+                self._save_state()
+            self._flush(force=True)
+        finally:
+            self._conn.close()
+            self._conn = None
+            self._client.close()
 
     def _count_request(self):
-        """Count request without stopping."""
+        """Count request without stopping; persisted with the next checkpoint."""
         self.state["requests_today"] += 1
-        self._save_state()
+        self._state_dirty = True
 
     def _parse_rate_limit_headers(self, response) -> dict[str, Any]:
         """Parse rate limit headers from response."""
@@ -225,58 +401,105 @@ class YouVersionDumper:
 
         return rate_limit_info
 
-    def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        self._count_request()
-        url = f"{BASE_URL}{path}"
-
+    def _send(self, path: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """
+        GET on the shared client, retrying timeouts, connection errors and 5xx
+        responses up to `max_retries` times.
+        """
+        attempts = self.max_retries + 1
+        for attempt in range(attempts):
+            is_last_attempt = attempt == attempts - 1
+            try:
+                response = self._client.get(path, params=params)
+            except (httpx.TimeoutException, httpx.ConnectError, TimeoutError) as exc:
+                if is_last_attempt:
+                    raise
+                logger.debug(f"GET {path} {exc!s}, retry {attempt + 1}/{self.max_retries}")
+                time.sleep(self.retry_interval)
+                continue
+            if response.status_code >= 500 and not is_last_attempt:
+                logger.debug(f"GET {path} returned {response.status_code}, retry {attempt + 1}/{self.max_retries}")
+                time.sleep(self.retry_interval)
+                continue
+            return response
+
+    async def _asend(self, path: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """Async counterpart of `_send` on the crawl's `AsyncClient`."""
+        attempts = self.max_retries + 1
+        for attempt in range(attempts):
+            is_last_attempt = attempt == attempts - 1
+            try:
+                response = await self._aclient.get(path, params=params)
+            except (httpx.TimeoutException, httpx.ConnectError, TimeoutError) as exc:
+                if is_last_attempt:
+                    raise
+                logger.debug(f"GET {path} {exc!s}, retry {attempt + 1}/{self.max_retries}")
+                await asyncio.sleep(self.retry_interval)
+                continue
+            if response.status_code >= 500 and not is_last_attempt:
+                logger.debug(f"GET {path} returned {response.status_code}, retry {attempt + 1}/{self.max_retries}")
+                await asyncio.sleep(self.retry_interval)
+                continue
+            return response
+
+    async def _throttle(self):
+        """
+        Token bucket for `sleep_sec`: request starts are spaced at least `sleep_sec` apart.
+        Also holds every request back during a rate limit pause (see `_rate_limit_wait`).
+        """
+        async with self._throttle_lock:
+            now = time.monotonic()
+            if self._next_request_at > now:
+                await asyncio.sleep(self._next_request_at - now)
+                now = self._next_request_at
+            self._next_request_at = now + self.sleep_sec
+
+    def _rate_limit_wait(self) -> float:
+        """
+        Seconds to wait before the next request, so the crawl stops short of a 429.
+        :return: 0 unless `remaining` is at the low watermark
+        """
+        remaining = self._rate.get("remaining")
+        if remaining is None or remaining > RATE_LIMIT_LOW_WATERMARK:
+            return 0.0
         try:
-            session = (
-                http_client.create(url)
-                .add_headers(self.headers)
-                .timeout(int(self.timeout_sec))
-                .retry(self.max_retries, self.retry_interval)
-            )
-
-            if params:
-                for key, value in params.items():
-                    session.add_query(key, value)
-
-            response = session.get()
-
-        except (
-            httpx.ReadTimeout,
-            httpx.ConnectTimeout,
-            httpx.TimeoutException,
-            TimeoutError,
-        ) as timeout_exc:
-            # http_client retry failed, save state and stop execution
-            error_msg = (
-                f"請求超時 (Read operation timed out): {url} "
-                f"(已重試 {self.max_retries} 次)"
-            )
-            logger.error(
-                error_msg,
-                extra={
-                    "url": url,
-                    "retry_count": self.max_retries,
-                    "timeout_sec": self.timeout_sec,
-                    "exception": str(timeout_exc),
-                },
-            )
-            self._save_state()
-            raise SystemExit(
-                f"{error_msg}。已保存 state, 請下次再跑。"
-            ) from timeout_exc
-
-        except Exception as exc:
-            # Other exceptions, record and re-raise
-            logger.error(
-                "請求發生未預期的錯誤: %s",
-                str(exc),
-                extra={"url": url, "exception_type": type(exc).__name__},
-            )
-            raise
+            reset = float(self._rate["reset"])
+        except (KeyError, ValueError, TypeError):
+            return float(self.retry_interval)
+        # Epoch timestamp or seconds until the window resets
+        if reset > 1_000_000_000:
+            reset -= time.time()
+        return max(0.0, reset)
+
+    def _permits(self) -> int:
+        """In-flight request budget, shrunk while the rate limit window runs low."""
+        remaining = self._rate.get("remaining")
+        if remaining is None:
+            return self.concurrency
+        return min(self.concurrency, max(1, remaining // 4))
+
+    def _stop_on_timeout(self, url: str, timeout_exc: BaseException):
+        # Retries exhausted, save state and stop execution
+        error_msg = (
+            f"請求超時 (Read operation timed out): {url} "
+            f"(已重試 {self.max_retries} 次)"
+        )
+        logger.error(
+            error_msg,
+            extra={
+                "url": url,
+                "retry_count": self.max_retries,
+                "timeout_sec": self.timeout_sec,
+                "exception": str(timeout_exc),
+            },
+        )
+        self._save_state()
+        raise SystemExit(
+            f"{error_msg}。已保存 state, 請下次再跑。"
+        ) from timeout_exc
 
+    def _handle_response(self, url: str, response: httpx.Response) -> Any:
+        """Stop on 429, raise on other 4xx/5xx, otherwise return the decoded body."""
         # Handle 429 (Too Many Requests) - parse headers and stop
         if response.status_code == 429:
             # Parse rate limit headers
@@ -298,14 +521,14 @@ class YouVersionDumper:
 
             # Try to parse error response body
             try:
-                error_body = response.json() if hasattr(response, "json") else None
+                error_body = orjson.loads(response.content)
                 if error_body:
                     logger.error(
                         "Rate limit error response: %s",
                         error_body,
                         extra={"status_code": 429, "url": url},
                     )
-            except (ValueError, TypeError, AttributeError):
+            except orjson.JSONDecodeError:
                 error_text = response.text[:500] if hasattr(response, "text") else ""
                 if error_text:
                     logger.error(
@@ -339,28 +562,93 @@ class YouVersionDumper:
 
             # Try to parse error response body for better error message
             try:
-                error_body = response.json() if hasattr(response, "json") else None
+                error_body = orjson.loads(response.content)
                 if error_body and isinstance(error_body, dict):
                     error_msg = error_body.get("message") or error_body.get("error")
                     if error_msg:
                         error_details += f": {error_msg}"
-            except (ValueError, TypeError, AttributeError):
+            except orjson.JSONDecodeError:
                 if error_text:
                     error_details += f": {error_text[:500]}"
 
             raise RuntimeError(error_details)
 
-        if self.sleep_sec:
-            time.sleep(self.sleep_sec)
+        self._rate = self._parse_rate_limit_headers(response)
+        return orjson.loads(response.content)
 
-        return response.json()
+    def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        self._count_request()
+        url = f"{BASE_URL}{path}"
+
+        try:
+            response = self._send(path, params)
+
+        except (
+            httpx.ReadTimeout,
+            httpx.ConnectTimeout,
+            httpx.TimeoutException,
+            TimeoutError,
+        ) as timeout_exc:
+            self._stop_on_timeout(url, timeout_exc)
+
+        except Exception as exc:
+            # Other exceptions, record and re-raise
+            logger.error(
+                "請求發生未預期的錯誤: %s",
+                str(exc),
+                extra={"url": url, "exception_type": type(exc).__name__},
+            )
+            raise
+
+        data = self._handle_response(url, response)
+
+        wait = max(self.sleep_sec, self._rate_limit_wait())
+        if wait:
+            time.sleep(wait)
+
+        return data
+
+    async def _aget(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Same error semantics as `_get`; `sleep_sec` is applied by `_throttle`."""
+        await self._throttle()
+        self._count_request()
+        url = f"{BASE_URL}{path}"
+
+        try:
+            response = await self._asend(path, params)
+
+        except (
+            httpx.ReadTimeout,
+            httpx.ConnectTimeout,
+            httpx.TimeoutException,
+            TimeoutError,
+        ) as timeout_exc:
+            self._stop_on_timeout(url, timeout_exc)
+
+        except Exception as exc:
+            # Other exceptions, record and re-raise
+            logger.error(
+                "請求發生未預期的錯誤: %s",
+                str(exc),
+                extra={"url": url, "exception_type": type(exc).__name__},
+            )
+            raise
+
+        data = self._handle_response(url, response)
+
+        wait = self._rate_limit_wait()
+        if wait:
+            logger.info(f"Rate limit almost exhausted ({self._rate}), pausing {wait:.0f}s")
+            self._next_request_at = max(self._next_request_at, time.monotonic() + wait)
+
+        return data
 
     def dump_meta(self) -> dict[str, Any]:
         bible = self._get(f"/v1/bibles/{self.bible_id}")
-        atomic_write_json(os.path.join(self.meta_dir, "bible.json"), bible)
+        atomic_write_json(os.path.join(self.meta_dir, "bible.json"), bible, ensure_dir=False)
 
         index = self._get(f"/v1/bibles/{self.bible_id}/index")
-        atomic_write_json(os.path.join(self.meta_dir, "index.json"), index)
+        atomic_write_json(os.path.join(self.meta_dir, "index.json"), index, ensure_dir=False)
         return index
 
     def _books(self, index_obj: Any) -> list[dict[str, Any]]:
@@ -373,7 +661,65 @@ class YouVersionDumper:
                 return v
         raise ValueError("index 回傳格式找不到 books[]。")
 
+    def merge_shards(self):
+        """
+        Copy the verses of every shard database on disk into passages.db, then remove the shard files.
+        Shards of an earlier run with a different shard count are merged as well.
+        """
+        self._flush(force=True)
+        columns = ", ".join(_INSERT_COLUMNS)
+        for shard in self._shard_numbers():
+            shard_db = self._shard_path(self.root_dir, "passages.db", shard)
+            if os.path.exists(shard_db):
+                self._conn.execute("ATTACH DATABASE ? AS shard", (shard_db,))
+                try:
+                    self._conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        # WHERE true: lets SQLite tell the upsert clause apart from a join constraint
+                        self._conn.execute(
+                            f"INSERT INTO verses ({columns}) SELECT {columns} FROM shard.verses WHERE true ON CONFLICT DO NOTHING"
+                        )
+                    except Exception:
+                        self._conn.execute("ROLLBACK")
+                        raise
+                    self._conn.execute("COMMIT")
+                finally:
+                    self._conn.execute("DETACH DATABASE shard")
+
+            shard_state_path = self._shard_path(self.root_dir, "state.json", shard)
+            self.state["requests_today"] += load_json(shard_state_path, {}).get("requests_today", 0)
+            for path in (shard_db, f"{shard_db}-wal", f"{shard_db}-shm", shard_state_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
     def dump_passages_by_chapter_from_index(self, index_obj: dict[str, Any]):
+        try:
+            asyncio.run(self._adump_passages(index_obj))
+        except _CrawlStopped as exc:
+            raise exc.args[0] from None
+
+    async def _fetch_all(self, paths: list[str], params: dict[str, Any], semaphore: asyncio.Semaphore) -> list[Any]:
+        """
+        Fetch passages concurrently, bounded by `semaphore`.
+        :return: Decoded bodies in submission order
+        """
+        async def bounded(path: str) -> Any:
+            async with semaphore:
+                try:
+                    return await self._aget(path, params=params)
+                except SystemExit as exc:
+                    # A SystemExit escaping a task tears down the loop, route it through gather instead
+                    raise _CrawlStopped(exc) from None
+
+        tasks = [asyncio.ensure_future(bounded(path)) for path in paths]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            # A failed request stops the chapter, don't leave siblings running
+            for task in tasks:
+                task.cancel()
+
+    async def _adump_passages(self, index_obj: dict[str, Any]):
         books = self._books(index_obj)
 
         start_bi = int(self.state.get("last_book_index", 0))
@@ -385,75 +731,140 @@ class YouVersionDumper:
             "include_headings": str(self.include_headings).lower(),
             "include_notes": str(self.include_notes).lower(),
         }
-
-        for bi in range(start_bi, len(books)):
-            book = books[bi]
-            book_id = book.get("id")  # 例如 GEN
-            if not book_id:
-                raise ValueError(f"book 缺少 id: {book}")
-
-            chapters = book.get("chapters")
-            if not isinstance(chapters, list):
-                raise ValueError(f"book.chapters 不是 list: book_id={book_id}")
-
-            ci0 = start_ci if bi == start_bi else 0
-
-            for ci in range(ci0, len(chapters)):
-                ch = chapters[ci]
-                ch_num = ch.get("title") or ch.get("id") or (ci + 1)
-
-                verses = ch.get("verses")
-                if not isinstance(verses, list):
-                    raise ValueError(
-                        f"chapter.verses 不是 list: book_id={book_id}, chapter={ch_num}"
-                    )
-
-                vi0 = start_vi if (bi == start_bi and ci == start_ci) else 0
-
-                for vi in range(vi0, len(verses)):
-                    verse = verses[vi]
-                    verse_num = verse.get("title") or verse.get("id") or (vi + 1)
-                    passage_id = verse.get("passage_id")  # 例如 GEN.1.1
-                    if not passage_id:
-                        raise ValueError(
-                            f"verse 缺少 passage_id: book_id={book_id}, chapter={ch_num}, verse={verse}"
+        # Column values of the request params, shared by every row of the dump
+        row_params = (self.format_, int(self.include_headings), int(self.include_notes))
+
+        self._throttle_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+        async with httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers=self.headers,
+            timeout=self.timeout_sec,
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+                keepalive_expiry=60,
+            ),
+        ) as client:
+            self._aclient = client
+            try:
+                for bi in range(start_bi, len(books)):
+                    book = books[bi]
+                    book_id = book.get("id")  # 例如 GEN
+                    if not book_id:
+                        raise ValueError(f"book 缺少 id: {book}")
+
+                    chapters = book.get("chapters")
+                    if not isinstance(chapters, list):
+                        raise ValueError(f"book.chapters 不是 list: book_id={book_id}")
+
+                    ci0 = start_ci if bi == start_bi else 0
+
+                    for ci in range(ci0, len(chapters)):
+                        ch = chapters[ci]
+                        ch_num = ch.get("title") or ch.get("id") or (ci + 1)
+
+                        verses = ch.get("verses")
+                        if not isinstance(verses, list):
+                            raise ValueError(
+                                f"chapter.verses 不是 list: book_id={book_id}, chapter={ch_num}"
+                            )
+
+                        vi0 = start_vi if (bi == start_bi and ci == start_ci) else 0
+
+                        jobs = []
+                        for vi in range(vi0, len(verses)):
+                            verse = verses[vi]
+                            verse_num = verse.get("title") or verse.get("id") or (vi + 1)
+                            passage_id = verse.get("passage_id")  # 例如 GEN.1.1
+                            if not passage_id:
+                                raise ValueError(
+                                    f"verse 缺少 passage_id: book_id={book_id}, chapter={ch_num}, verse={verse}"
+                                )
+                            if passage_id in self._have:
+                                continue
+                            jobs.append((verse_num, passage_id))
+
+                        results = await self._fetch_all(
+                            [f"/v1/bibles/{self.bible_id}/passages/{passage_id}" for _, passage_id in jobs],
+                            params,
+                            asyncio.Semaphore(self._permits()),
                         )
 
-                    data = self._get(
-                        f"/v1/bibles/{self.bible_id}/passages/{passage_id}",
-                        params=params,
-                    )
+                        # Insert in submission order so the checkpoint below covers every verse of the chapter
+                        for (verse_num, passage_id), data in zip(jobs, results):
+                            self._insert_verse(
+                                book_id=book_id,
+                                chapter=ch_num,
+                                verse=verse_num,
+                                passage_id=passage_id,
+                                params=row_params,
+                                data=data,
+                            )
+                            self._flush()
+
+                        # Chapter completed, saved with the next flush
+                        self.state["last_book_index"] = bi
+                        self.state["last_chapter_index"] = ci + 1
+                        self.state["last_verse_index"] = 0
+                        self.state["done"] = False
+                        self._state_dirty = True
+
+                    # Book completed, saved with the next flush
+                    self.state["last_book_index"] = bi + 1
+                    self.state["last_chapter_index"] = 0
+                    self.state["last_verse_index"] = 0
+                    self._state_dirty = True
+            finally:
+                self._aclient = None
 
-                    self._insert_verse(
-                        book_id=book_id,
-                        chapter=ch_num,
-                        verse=verse_num,
-                        passage_id=passage_id,
-                        params=params,
-                        data=data,
-                    )
+        self.state["done"] = True
+        self._save_state()
 
-                    # Update breakpoint: next chapter
-                    self.state["last_book_index"] = bi
-                    self.state["last_chapter_index"] = ci
-                    self.state["last_verse_index"] = vi + 1
-                    self.state["done"] = False
-                    self._save_state()
-
-                # Chapter completed
-                self.state["last_book_index"] = bi
-                self.state["last_chapter_index"] = ci + 1
-                self.state["last_verse_index"] = 0
-                self._save_state()
 
-            # Book completed
-            self.state["last_book_index"] = bi + 1
-            self.state["last_chapter_index"] = 0
-            self.state["last_verse_index"] = 0
-            self._save_state()
+def _dump_shard(dumper_kwargs: dict[str, Any], shard: int, shards: int, books: list[dict[str, Any]]):
+    """Process pool entry: crawl one shard of books into its own database."""
+    dumper = YouVersionDumper(**dumper_kwargs, shard=shard, shards=shards)
+    try:
+        dumper.dump_passages_by_chapter_from_index({"books": books})
+    finally:
+        dumper.close()
 
-        self.state["done"] = True
-        self._save_state()
+
+def dump_passages_in_shards(dumper: YouVersionDumper, dumper_kwargs: dict[str, Any], index_obj: dict[str, Any], shards: int):
+    """
+    Crawl books in `shards` worker processes, then merge the shard databases into passages.db.
+    Each shard resumes from its own state file, so a stopped run picks up where every shard left off.
+    A run with a different shard count splits the books differently, so the shard files left by
+    the earlier run are merged first and the shards start over, skipping verses already in passages.db.
+    :param dumper: Dumper owning passages.db and state.json
+    :param dumper_kwargs: Arguments used to create `dumper`, passed on to the shard workers
+    :param index_obj: Bible index from `dump_meta`
+    :param shards: Number of worker processes
+    """
+    books = dumper._books(index_obj)
+    shards = max(1, min(shards, len(books)))
+    if not dumper.state.get("done"):
+        if any(
+            load_json(dumper._shard_path(dumper.root_dir, "state.json", shard), {}).get("shards") != shards
+            for shard in dumper._shard_numbers()
+        ):
+            dumper.merge_shards()
+        # Each shard throttles on its own, so space its requests `shards` times wider to keep the combined rate of one crawler
+        shard_kwargs = {**dumper_kwargs, "sleep_sec": dumper_kwargs["sleep_sec"] * shards}
+        # Interleave books so the long Old Testament books don't all land in one shard
+        with concurrent.futures.ProcessPoolExecutor(max_workers=shards) as pool:
+            futures = [pool.submit(_dump_shard, shard_kwargs, shard, shards, books[shard::shards]) for shard in range(shards)]
+            for future in futures:
+                # Re-raises SystemExit (429, timeouts) or errors of a shard once all shards have stopped
+                future.result()
+
+    dumper.merge_shards()
+    dumper.state["last_book_index"] = len(books)
+    dumper.state["last_chapter_index"] = 0
+    dumper.state["last_verse_index"] = 0
+    dumper.state["done"] = True
+    dumper._save_state()
 
 
 def dump_bible(
@@ -466,20 +877,24 @@ def dump_bible(
     include_notes: bool,
     format_: str,
     meta_only: bool,
+    concurrency: int = 8,
+    parallel_books: int = 1,
 ):
     """
     Dump YouVersion Bible metadata and passages.
     """
-    dumper = YouVersionDumper(
-        bible_id=bible_id,
-        out_dir=out_dir,
-        daily_limit=daily_limit,
-        sleep_sec=sleep_sec,
-        timeout_sec=timeout_sec,
-        include_headings=include_headings,
-        include_notes=include_notes,
-        format_=format_,
-    )
+    dumper_kwargs = {
+        "bible_id": bible_id,
+        "out_dir": out_dir,
+        "daily_limit": daily_limit,
+        "sleep_sec": sleep_sec,
+        "timeout_sec": timeout_sec,
+        "include_headings": include_headings,
+        "include_notes": include_notes,
+        "format_": format_,
+        "concurrency": concurrency,
+    }
+    dumper = YouVersionDumper(**dumper_kwargs)
 
     try:
         click.echo(click.style(f"Dumping Bible ID: {bible_id}", fg="cyan"))
@@ -488,7 +903,10 @@ def dump_bible(
 
         if not meta_only:
             click.echo(click.style("Dumping passages...", fg="cyan"))
-            dumper.dump_passages_by_chapter_from_index(index_obj)
+            if parallel_books > 1:
+                dump_passages_in_shards(dumper, dumper_kwargs, index_obj, parallel_books)
+            else:
+                dumper.dump_passages_by_chapter_from_index(index_obj)
             click.echo(click.style("All passages dumped successfully.", fg="green"))
         else:
             click.echo(click.style("Meta-only mode: skipping passages.", fg="yellow"))
@@ -500,6 +918,8 @@ def dump_bible(
         click.echo(click.style(f"Error dumping Bible: {e}", fg="red"))
         logger.exception(e)
         raise
+    finally:
+        dumper.close()
 
 
 def dump_bible_process(
@@ -512,8 +932,12 @@ def dump_bible_process(
     include_notes: bool,
     format_: str,
     meta_only: bool,
+    concurrency: int = 8,
+    parallel_books: int = 1,
 ):
     """Synchronous entry to run Bible dumping."""
+    # Load environment variables (YVP_APP_KEY) from .env file, only needed by the CLI
+    load_dotenv()
     dump_bible(
         bible_id=bible_id,
         out_dir=out_dir,
@@ -524,4 +948,6 @@ def dump_bible_process(
         include_notes=include_notes,
         format_=format_,
         meta_only=meta_only,
+        concurrency=concurrency,
+        parallel_books=parallel_books,
     )
@@ -2,25 +2,102 @@
 Import Bible data from bible_data directory to database
 """
 import asyncio
-import json
+import contextlib
+import itertools
 import sqlite3
 import time
 from pathlib import Path
-from uuid import UUID
 
 import click
+import orjson
+from redis.asyncio import Redis
+from sqlalchemy.dialects import postgresql
 
+from portal.config import settings
 from portal.container import Container
+from portal.libs.consts.cache_keys import bible_books_key, bible_versions_key
+from portal.libs.database import Session
 from portal.libs.logger import logger
+from portal.libs.shared import validator
 from portal.models import BibleBook, BibleVerse, BibleVersion
 
-
-async def import_bible_data(bible_id: str, data_dir: str = "bible_data"):
+# Schema-qualified and quoted, the connections don't set search_path to the models' schema
+VERSE_TABLE = postgresql.dialect().identifier_preparer.format_table(BibleVerse.__table__)
+VERSE_COLUMNS = ["book_id", "chapter", "verse", "passage_id", "content"]
+VERSE_STAGE_TABLE = "bible_verses_stage"
+VERSE_UPSERT_CLAUSE = """
+    ON CONFLICT (book_id, passage_id) DO UPDATE
+    SET chapter = EXCLUDED.chapter, verse = EXCLUDED.verse, content = EXCLUDED.content
+"""
+BULK_MODES = ("copy", "executemany", "values")
+SQLITE_FETCH_SIZE = 10000
+PROGRESS_INTERVAL_SEC = 2.0
+# asyncpg binds at most 32767 arguments per statement
+MAX_BIND_PARAMS = 32767
+VALUES_ROWS_PER_STATEMENT = MAX_BIND_PARAMS // len(VERSE_COLUMNS)
+
+
+async def _copy_verses(session: Session, records):
+    """COPY into a stage table, then upsert everything with a single statement"""
+    # The stage table lives in this transaction only (ON COMMIT DROP)
+    await session.execute(
+        f"CREATE TEMP TABLE {VERSE_STAGE_TABLE} (LIKE {VERSE_TABLE} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    await session.copy_records_to_table(VERSE_STAGE_TABLE, records=records, columns=VERSE_COLUMNS)
+    columns = ", ".join(VERSE_COLUMNS)
+    await session.execute(
+        f"INSERT INTO {VERSE_TABLE} ({columns}) SELECT {columns} FROM {VERSE_STAGE_TABLE} {VERSE_UPSERT_CLAUSE}"
+    )
+
+
+async def _executemany_verses(session: Session, records, batch_size: int):
+    """Upsert through a pipelined executemany per batch, for servers where COPY is not allowed"""
+    placeholders = ", ".join(f"${index}" for index in range(1, len(VERSE_COLUMNS) + 1))
+    sql = f"INSERT INTO {VERSE_TABLE} ({', '.join(VERSE_COLUMNS)}) VALUES ({placeholders}) {VERSE_UPSERT_CLAUSE}"
+    # Parsed and planned once, each batch only binds and executes
+    statement = await session.prepare(sql)
+    for batch in itertools.batched(records, batch_size):
+        await statement.executemany(batch)
+
+
+def _verse_values_sql(rows: int) -> str:
+    """Multi-row INSERT ... VALUES with one upsert clause for the given number of verses"""
+    width = len(VERSE_COLUMNS)
+    values = ", ".join(
+        "(" + ", ".join(f"${row * width + column}" for column in range(1, width + 1)) + ")"
+        for row in range(rows)
+    )
+    return f"INSERT INTO {VERSE_TABLE} ({', '.join(VERSE_COLUMNS)}) VALUES {values} {VERSE_UPSERT_CLAUSE}"
+
+
+async def _values_verses(session: Session, records):
+    """Upsert through multi-row VALUES statements, as many verses per statement as the bind limit allows"""
+    full_sql = None
+    for batch in itertools.batched(records, VALUES_ROWS_PER_STATEMENT):
+        if len(batch) == VALUES_ROWS_PER_STATEMENT:
+            # Every statement but the last has the same shape, build its SQL once
+            full_sql = full_sql or _verse_values_sql(VALUES_ROWS_PER_STATEMENT)
+            sql = full_sql
+        else:
+            sql = _verse_values_sql(len(batch))
+        await session.execute(sql, *itertools.chain.from_iterable(batch))
+
+
+async def _invalidate_bible_cache(redis: Redis, bible_version_id):
+    """Drop the cached version lists and the version's book list, so the import shows up right away"""
+    # One versions key per language filter requested so far
+    version_keys = [key async for key in redis.scan_iter(match=bible_versions_key("*"))]
+    await redis.delete(bible_books_key(str(bible_version_id)), *version_keys)
+
+
+async def import_bible_data(bible_id: str, data_dir: str = "bible_data", bulk_mode: str = "copy", batch_size: int = 16000):
     """
     Import Bible data from bible_data directory to database
 
     :param bible_id: Bible ID (e.g., '1392')
     :param data_dir: Directory containing bible data (default: 'bible_data')
+    :param bulk_mode: How verses are written, 'copy' (default), 'executemany' or 'values'
+    :param batch_size: Verses per executemany batch
     """
     container = Container()
     session = container.db_session()
@@ -40,21 +117,23 @@ async def import_bible_data(bible_id: str, data_dir: str = "bible_data"):
         raise FileNotFoundError(f"Passages database not found: {passages_db_path}")
 
     try:
+        # Version, books and verses are imported in one transaction. The import can simply be rerun,
+        # so the commit doesn't need to wait for the WAL flush
+        await session.execute("SET LOCAL synchronous_commit = off")
+
         # 1. Load and import Bible Version
         click.echo(f"Loading Bible version data from {bible_json_path}...")
-        with open(bible_json_path, encoding="utf-8") as f:
-            bible_meta = json.load(f)
+        bible_meta = orjson.loads(bible_json_path.read_bytes())
 
-        # Convert organization_id to UUID if present
-        organization_id = None
-        if bible_meta.get("organization_id"):
-            try:
-                organization_id = UUID(bible_meta["organization_id"])
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid organization_id: {bible_meta.get('organization_id')}")
+        # Keep organization_id as a string if present, asyncpg binds it to the uuid column as is
+        organization_id = bible_meta.get("organization_id") or None
+        if organization_id is not None and not validator.is_uuid(organization_id):
+            logger.warning(f"Invalid organization_id: {organization_id}")
+            organization_id = None
 
         click.echo(f"Importing Bible version: {bible_meta.get('localized_title', bible_meta.get('title'))}...")
-        await (
+        # RETURNING gives the version ID for both the insert and the update branch
+        version = await (
             session.insert(BibleVersion)
             .values(
                 youversion_bible_id=str(bible_meta["id"]),
@@ -86,14 +165,7 @@ async def import_bible_data(bible_id: str, data_dir: str = "bible_data"):
                     "is_active": True,
                 },
             )
-            .execute()
-        )
-        await session.commit()
-
-        # Get the version ID
-        version = await (
-            session.select(BibleVersion.id)
-            .where(BibleVersion.youversion_bible_id == str(bible_meta["id"]))
+            .returning(BibleVersion.id)
             .fetchval()
         )
         if not version:
@@ -103,163 +175,130 @@ async def import_bible_data(bible_id: str, data_dir: str = "bible_data"):
 
         # 2. Load and import Bible Books
         click.echo(f"Loading Bible books data from {index_json_path}...")
-        with open(index_json_path, encoding="utf-8") as f:
-            index_data = json.load(f)
+        index_data = orjson.loads(index_json_path.read_bytes())
 
         books_data = index_data.get("books", [])
         click.echo(f"Importing {len(books_data)} books...")
 
-        book_id_map = {}  # Map book_code to book_id (UUID)
-        base_timestamp = time.time()  # Base timestamp for sequence calculation
-        sort_order = 1  # Sort order (1-66 for standard Bible book order)
-
-        for book_data in books_data:
-            book_code = book_data["id"]
-            book_title = book_data.get("title", "")
-            full_title = book_data.get("full_title")
-            abbreviation = book_data.get("abbreviation")
-            canon = book_data.get("canon", "old_testament")
+        book_rows = []
 
+        # Sort order 1-66 for standard Bible book order
+        for sort_order, book_data in enumerate(books_data, start=1):
             # Calculate chapter count from chapters array
             chapters = book_data.get("chapters", [])
             chapter_count = len(chapters) if isinstance(chapters, list) else 0
 
-            # Calculate sequence using base timestamp + small increment to maintain order
-            # Use sort_order * 0.001 to preserve relative order while using timestamp format
-            sequence = base_timestamp + (sort_order * 0.001)
-
-            # Insert or update book
-            await (
-                session.insert(BibleBook)
-                .values(
-                    bible_version_id=version,
-                    book_code=book_code,
-                    title=book_title,
-                    full_title=full_title,
-                    abbreviation=abbreviation,
-                    canon=canon,
-                    sequence=sequence,
-                    chapter_count=chapter_count,
-                )
+            book_rows.append({
+                "bible_version_id": version,
+                "book_code": book_data["id"],
+                "title": book_data.get("title", ""),
+                "full_title": book_data.get("full_title"),
+                "abbreviation": book_data.get("abbreviation"),
+                "canon": book_data.get("canon", "old_testament"),
+                # Float column (SortableMixin), the position in the index is enough
+                "sequence": float(sort_order),
+                "chapter_count": chapter_count,
+            })
+
+        # Insert or update all books in one statement, RETURNING gives the book IDs
+        book_id_map = {}  # Map book_code to book_id (UUID)
+        if book_rows:
+            books_insert = session.insert(BibleBook).values(book_rows)
+            excluded = books_insert.excluded
+            books = await (
+                books_insert
                 .on_conflict_do_update(
                     index_elements=[BibleBook.bible_version_id, BibleBook.book_code],
                     set_={
-                        "title": book_title,
-                        "full_title": full_title,
-                        "abbreviation": abbreviation,
-                        "canon": canon,
-                        "sequence": sequence,
-                        "chapter_count": chapter_count,
+                        "title": excluded.title,
+                        "full_title": excluded.full_title,
+                        "abbreviation": excluded.abbreviation,
+                        "canon": excluded.canon,
+                        "sequence": excluded.sequence,
+                        "chapter_count": excluded.chapter_count,
                     },
                 )
-                .execute()
-            )
-
-            # Get the book ID
-            book = await (
-                session.select(BibleBook.id)
-                .where(BibleBook.bible_version_id == version)
-                .where(BibleBook.book_code == book_code)
-                .fetchval()
+                .returning(BibleBook.id, BibleBook.book_code)
+                .fetch()
             )
-            if book:
-                book_id_map[book_code] = book
-
-            sort_order += 1
+            book_id_map = {book["book_code"]: book["id"] for book in books}
 
-        await session.commit()
         click.echo(f"Imported {len(book_id_map)} books")
 
         # 3. Load and import Bible Verses
         click.echo(f"Loading verses from {passages_db_path}...")
-        conn = sqlite3.connect(passages_db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        # Count total verses
-        cursor.execute("SELECT COUNT(*) FROM verses")
-        total_verses = cursor.fetchone()[0]
-        click.echo(f"Found {total_verses} verses to import...")
-
-        # Fetch verses in batches
-        batch_size = 1000
-        cursor.execute("SELECT bible_id, book_id, chapter, verse, passage_id, data FROM verses ORDER BY book_id, chapter, verse")
-
-        imported_count = 0
-        batch = []
-
-        for row in cursor:
-            book_code = row["book_id"]
-            book_id = book_id_map.get(book_code)
-            if not book_id:
-                logger.warning(f"Book not found for book_code: {book_code}, skipping verse {row['passage_id']}")
-                continue
-
-            # Parse verse content from JSON data
+        # The dump is only read: immutable=1 skips locking and the journal/WAL files entirely
+        sqlite_uri = f"{passages_db_path.resolve().as_uri()}?mode=ro&immutable=1"
+        with contextlib.closing(sqlite3.connect(sqlite_uri, uri=True)) as conn:
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+            cursor = conn.cursor()
+
+            # Count total verses
+            cursor.execute("SELECT COUNT(*) FROM verses")
+            total_verses = cursor.fetchone()[0]
+            click.echo(f"Found {total_verses} verses to import...")
+
+            # Fetch verses in batches. Upserts are keyed by (book_id, passage_id), so row order doesn't matter.
+            # JSON1 extracts the content while fetching; invalid payloads are flagged instead of aborting the scan
             try:
-                verse_data = json.loads(row["data"])
-                content = verse_data.get("content", "")
-            except (json.JSONDecodeError, TypeError):
-                logger.warning(f"Failed to parse verse data for {row['passage_id']}")
-                continue
-
-            chapter = int(row["chapter"]) if row["chapter"] else None
-            verse = int(row["verse"]) if row["verse"] else None
-
-            if chapter is None or verse is None:
-                logger.warning(f"Invalid chapter/verse for {row['passage_id']}")
-                continue
-
-            batch.append({
-                "book_id": book_id,
-                "chapter": chapter,
-                "verse": verse,
-                "passage_id": row["passage_id"],
-                "content": content,
-            })
-
-            if len(batch) >= batch_size:
-                # Insert batch
-                for verse_data in batch:
-                    await (
-                        session.insert(BibleVerse)
-                        .values(**verse_data)
-                        .on_conflict_do_update(
-                            index_elements=["book_id", "passage_id"],
-                            set_={
-                                "chapter": verse_data["chapter"],
-                                "verse": verse_data["verse"],
-                                "content": verse_data["content"],
-                            },
-                        )
-                        .execute()
-                    )
-
-                await session.commit()
-                imported_count += len(batch)
-                click.echo(f"Imported {imported_count}/{total_verses} verses...")
-                batch = []
-
-        # Insert remaining batch
-        if batch:
-            for verse_data in batch:
-                await (
-                    session.insert(BibleVerse)
-                    .values(**verse_data)
-                    .on_conflict_do_update(
-                        index_elements=["book_id", "passage_id"],
-                        set_={
-                            "chapter": verse_data["chapter"],
-                            "verse": verse_data["verse"],
-                            "content": verse_data["content"],
-                        },
-                    )
-                    .execute()
+                cursor.execute(
+                    "SELECT book_id, chapter, verse, passage_id, json_valid(data), "
+                    "CASE WHEN json_valid(data) THEN json_extract(data, '$.content') END FROM verses"
                 )
+                parse_data = False
+            except sqlite3.OperationalError:
+                # SQLite built without JSON1
+                cursor.execute("SELECT book_id, chapter, verse, passage_id, 1, data FROM verses")
+                parse_data = True
+
+            imported_count = 0
+
+            def verse_records():
+                """Stream COPY records straight from the SQLite cursor"""
+                nonlocal imported_count
+                last_report = time.monotonic()
+                while rows := cursor.fetchmany(SQLITE_FETCH_SIZE):
+                    # Report progress at most every PROGRESS_INTERVAL_SEC, checked once per fetched batch
+                    now = time.monotonic()
+                    if now - last_report >= PROGRESS_INTERVAL_SEC:
+                        click.echo(f"Imported {imported_count}/{total_verses} verses...")
+                        last_report = now
+                    for book_code, chapter, verse, passage_id, is_valid, content in rows:
+                        book_id = book_id_map.get(book_code)
+                        if not book_id:
+                            logger.warning(f"Book not found for book_code: {book_code}, skipping verse {passage_id}")
+                            continue
+
+                        if parse_data:
+                            try:
+                                content = orjson.loads(content).get("content")
+                            except (orjson.JSONDecodeError, TypeError):
+                                is_valid = False
+                        if not is_valid:
+                            logger.warning(f"Failed to parse verse data for {passage_id}")
+                            continue
+                        if content is None:
+                            content = ""
+
+                        # INTEGER values come back as int already; NULL or a non-numeric title can't be imported
+                        if type(chapter) is not int or type(verse) is not int:
+                            logger.warning(f"Invalid chapter/verse for {passage_id}")
+                            continue
+
+                        yield book_id, chapter, verse, passage_id, content
+                        imported_count += 1
+
+            if bulk_mode == "executemany":
+                await _executemany_verses(session, verse_records(), batch_size)
+            elif bulk_mode == "values":
+                await _values_verses(session, verse_records())
+            else:
+                await _copy_verses(session, verse_records())
             await session.commit()
-            imported_count += len(batch)
 
-        conn.close()
+        await _invalidate_bible_cache(container.redis_client().create(db=settings.REDIS_DB), version)
+
         click.echo(f"Successfully imported {imported_count} verses")
         click.echo(f"Bible data import completed for {bible_id}")
 
@@ -272,7 +311,7 @@ async def import_bible_data(bible_id: str, data_dir: str = "bible_data"):
         await session.close()
 
 
-def import_bible_data_process(bible_id: str, data_dir: str = "bible_data"):
+def import_bible_data_process(bible_id: str, data_dir: str = "bible_data", bulk_mode: str = "copy", batch_size: int = 16000):
     """Synchronous entry point for importing Bible data"""
-    asyncio.run(import_bible_data(bible_id=bible_id, data_dir=data_dir))
+    asyncio.run(import_bible_data(bible_id=bible_id, data_dir=data_dir, bulk_mode=bulk_mode, batch_size=batch_size))
 
@@ -4,7 +4,7 @@ CLI main entry point
 import click
 
 from .bible import dump_bible_process
-from .import_bible import import_bible_data_process
+from .import_bible import BULK_MODES, import_bible_data_process
 
 
 @click.group()
@@ -22,6 +22,13 @@ def cli():
 @click.option("--include-headings", default=False, is_flag=True, help="Passages include_headings=true")
 @click.option("--include-notes", default=False, is_flag=True, help="Passages include_notes=true")
 @click.option("--meta-only", is_flag=True, help="Only fetch bible/index, not passages")
+@click.option("--concurrency", type=click.IntRange(min=1), default=8, help="Maximum passage requests in flight")
+@click.option(
+    "--parallel-books",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Crawl books in N processes (each with its own --concurrency, sharing the --sleep rate), merged into passages.db at the end",
+)
 def dump_bible_cmd(
     bible_id: str,
     out: str,
@@ -32,6 +39,8 @@ def dump_bible_cmd(
     include_headings: bool,
     include_notes: bool,
     meta_only: bool,
+    concurrency: int,
+    parallel_books: int,
 ):
     """Dump YouVersion Bible metadata + passages with resume support.
 
@@ -47,13 +56,17 @@ def dump_bible_cmd(
         include_notes=include_notes,
         format_=format_,
         meta_only=meta_only,
+        concurrency=concurrency,
+        parallel_books=parallel_books,
     )
 
 
 @cli.command(name="import-bible")
 @click.option("--bible-id", required=True, help="Bible ID (e.g., 1392)")
 @click.option("--data-dir", default="bible_data", help="Bible data directory (default: bible_data)")
-def import_bible_cmd(bible_id: str, data_dir: str):
+@click.option("--bulk-mode", type=click.Choice(BULK_MODES), default="copy", help="Write verses with COPY + one upsert, pipelined executemany batches, or multi-row VALUES statements")
+@click.option("--batch-size", type=click.IntRange(min=1), default=16000, help="Verses per executemany batch")
+def import_bible_cmd(bible_id: str, data_dir: str, bulk_mode: str, batch_size: int):
     """
     Import Bible data from bible_data directory to database.
     This command imports:
@@ -61,7 +74,7 @@ def import_bible_cmd(bible_id: str, data_dir: str):
     2. Bible books from bible_data/{bible_id}/meta/index.json
     3. Bible verses from bible_data/{bible_id}/passages.db
     """
-    import_bible_data_process(bible_id=bible_id, data_dir=data_dir)
+    import_bible_data_process(bible_id=bible_id, data_dir=data_dir, bulk_mode=bulk_mode, batch_size=batch_size)
 
 
 def main() -> int:
@@ -2,6 +2,7 @@
 Configuration
 """
 
+import json
 import logging
 import os
 from functools import lru_cache
@@ -10,7 +11,7 @@ from typing import Any
 
 import yaml
 from dotenv import load_dotenv
-from pydantic import model_validator
+from pydantic import AliasChoices, Field, model_validator
 from pydantic.fields import FieldInfo
 from pydantic_settings import (
     BaseSettings,
@@ -24,6 +25,34 @@ from portal.schemas.rate_limiter import RateLimitersConfig
 load_dotenv()
 
 
+def _read_rate_limiters_yaml(path: Path) -> dict:
+    """
+    Parse the rate limiters YAML, cached as JSON next to it and keyed by the YAML mtime,
+    so a new process (every CLI run, every worker) skips the pure-Python YAML parse.
+    :param path: YAML file
+    :return:
+    """
+    mtime_ns = path.stat().st_mtime_ns
+    cache_path = path.with_name(f".{path.name}.cache.json")
+    try:
+        cached = json.loads(cache_path.read_text())
+        if cached["mtime_ns"] == mtime_ns:
+            return cached["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    config_dict = yaml.safe_load(path.read_text())
+    # Written aside and renamed into place, so a worker starting concurrently never reads half a file
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps({"mtime_ns": mtime_ns, "config": config_dict}))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError):
+        # Read-only location (e.g. /etc/secrets) or values JSON can't hold, parse again next time
+        tmp_path.unlink(missing_ok=True)
+    return config_dict
+
+
 class CustomSource(EnvSettingsSource):
 
     def prepare_field_value(
@@ -61,107 +90,98 @@ class Configuration(BaseSettings):
         return (CustomSource(settings_cls),)
 
     # [App Base]
+    # Values come from the environment through CustomSource, the class body only holds defaults
     APP_NAME: str = "rooted-portal-api"
-    ENV: str = os.getenv(key="ENV", default="dev").lower()
-    APP_VERSION: str = os.getenv(key="VERSION", default="v0.1.0")
-    IS_PROD: bool = ENV == "prod"
-    IS_DEV: bool = ENV not in ["prod", "stg"]
-    APP_FQDN: str = os.getenv(key="APP_FQDN", default="localhost")
-    BASE_URL: str = (
-        f"https://{APP_FQDN}" if not IS_DEV else f"http://{APP_FQDN}"
-    )  # noqa
-    ADMIN_PORTAL_URL: str = os.getenv(
-        key="ADMIN_PORTAL_URL", default="http://localhost:5173"
-    )
+    ENV: str = "dev"
+    APP_VERSION: str = Field(default="v0.1.0", validation_alias=AliasChoices("APP_VERSION", "VERSION"))
+    # Derived from ENV / APP_FQDN in `_derive_settings` unless set in the environment
+    IS_PROD: bool | None = None
+    IS_DEV: bool | None = None
+    APP_FQDN: str = "localhost"
+    BASE_URL: str | None = None
+    ADMIN_PORTAL_URL: str = "http://localhost:5173"
 
     # [FastAPI]
-    HOST: str = os.getenv(key="HOST", default="127.0.0.1")
-    PORT: int = os.getenv(key="PORT", default=8000)
+    HOST: str = "127.0.0.1"
+    PORT: int = 8000
 
     # [CORS]
-    CORS_ALLOWED_ORIGINS: list[str] = os.getenv(
-        key="CORS_ALLOWED_ORIGINS", default="*"
-    ).split()
-    CORS_ALLOW_ORIGINS_REGEX: str | None = os.getenv(key="CORS_ALLOW_ORIGINS_REGEX")
+    CORS_ALLOWED_ORIGINS: list[str] = ["*"]
+    CORS_ALLOW_ORIGINS_REGEX: str | None = None
 
     # [AWS]
     # AWS_STORAGE_BUCKET_NAME: str = APP_NAME
-    # AWS_ACCESS_KEY_ID: str = os.getenv(key="AWS_ACCESS_KEY_ID")
-    # AWS_SECRET_ACCESS_KEY: str = os.getenv(key="AWS_SECRET_ACCESS_KEY")
-    # AWS_S3_REGION_NAME: str = os.getenv(key="AWS_S3_REGION_NAME")
-    AWS_S3_CACHE_CONTROL: str = os.getenv(
-        key="AWS_S3_CACHE_CONTROL", default="max-age=86400"
-    )
-    MAX_UPLOAD_SIZE: int = int(
-        os.getenv(key="MAX_UPLOAD_SIZE", default=5 * 1024 * 1024)
-    )  # 5MB
+    # AWS_ACCESS_KEY_ID: str | None = None
+    # AWS_SECRET_ACCESS_KEY: str | None = None
+    # AWS_S3_REGION_NAME: str | None = None
+    AWS_S3_CACHE_CONTROL: str = "max-age=86400"
+    MAX_UPLOAD_SIZE: int = 5 * 1024 * 1024  # 5MB
 
     # [Redis]
-    REDIS_URL: str | None = os.getenv(key="REDIS_URL")
-    REDIS_DB: int = int(os.getenv(key="REDIS_DB", default="0"))
+    REDIS_URL: str | None = None
+    REDIS_DB: int = 0
 
     # [Database]
-    DATABASE_HOST: str = os.getenv(key="DATABASE_HOST", default="localhost")
-    DATABASE_USER: str = os.getenv(key="DATABASE_USER", default="postgres")
-    DATABASE_PASSWORD: str = os.getenv(key="DATABASE_PASSWORD", default="")
-    DATABASE_PORT: str = os.getenv(key="DATABASE_PORT", default="5432")
-    DATABASE_NAME: str = os.getenv(key="DATABASE_NAME", default="postgres")
-    DATABASE_SCHEMA: str = os.getenv(key="DATABASE_SCHEMA", default="public")
-    DATABASE_CONNECTION_POOL_MAX_SIZE: int = os.getenv(
-        "DATABASE_CONNECTION_POOL_MAX_SIZE", 10
-    )
+    DATABASE_HOST: str = "localhost"
+    DATABASE_USER: str = "postgres"
+    DATABASE_PASSWORD: str = ""
+    DATABASE_PORT: str = "5432"
+    DATABASE_NAME: str = "postgres"
+    DATABASE_SCHEMA: str = "public"
+    DATABASE_CONNECTION_POOL_MAX_SIZE: int = 10
     DATABASE_APPLICATION_NAME: str = APP_NAME
 
-    DATABASE_POOL: bool = os.getenv("DATABASE_POOL", True)
-    SQL_ECHO: bool = os.getenv("SQL_ECHO", False)
-    SQLALCHEMY_DATABASE_URI: str = (
-        f"postgresql://{DATABASE_USER}:{DATABASE_PASSWORD}@{DATABASE_HOST}:{DATABASE_PORT}/{DATABASE_NAME}"
-    )
-    ASYNC_DATABASE_URL: str = (
-        f"postgresql+asyncpg://{DATABASE_USER}:{DATABASE_PASSWORD}@"
-        f"{DATABASE_HOST}:{DATABASE_PORT}/{DATABASE_NAME}"
-    )
+    DATABASE_POOL: bool = True
+    # asyncpg prepared statement cache per connection, 0 disables it (e.g. around schema migrations)
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+    SQL_ECHO: bool = False
+    # Built from the DATABASE_* settings in `_derive_settings` unless set in the environment
+    SQLALCHEMY_DATABASE_URI: str | None = None
+    ASYNC_DATABASE_URL: str | None = None
 
     # [JWT]
-    JWT_SECRET_KEY: str = os.getenv(key="JWT_SECRET_KEY")
-    JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
-        os.getenv(key="JWT_ACCESS_TOKEN_EXPIRE_MINUTES", default="15")
-    )
-    REFRESH_TOKEN_EXPIRE_DAYS: int = int(
-        os.getenv(key="REFRESH_TOKEN_EXPIRE_DAYS", default="7")
-    )
-    REFRESH_TOKEN_HASH_SALT: str = os.getenv(key="REFRESH_TOKEN_HASH_SALT", default="")
-    REFRESH_TOKEN_HASH_PEPPER: str = os.getenv(
-        key="REFRESH_TOKEN_HASH_PEPPER", default=""
-    )
+    JWT_SECRET_KEY: str
+    JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    REFRESH_TOKEN_HASH_SALT: str = ""
+    REFRESH_TOKEN_HASH_PEPPER: str = ""
 
     # [Password Reset]
-    PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = int(
-        os.getenv(key="PASSWORD_RESET_TOKEN_EXPIRE_MINUTES", default="60")
-    )
-    PASSWORD_RESET_TOKEN_SALT: str = os.getenv(
-        key="PASSWORD_RESET_TOKEN_SALT", default=""
-    )
+    PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 60
+    PASSWORD_RESET_TOKEN_SALT: str = ""
 
     # [Token Blacklist]
-    TOKEN_BLACKLIST_REDIS_DB: int = int(
-        os.getenv(key="TOKEN_BLACKLIST_REDIS_DB", default="1")
-    )
-    TOKEN_BLACKLIST_CLEANUP_INTERVAL: int = int(
-        os.getenv(key="TOKEN_BLACKLIST_CLEANUP_INTERVAL", default="3600")
-    )
+    TOKEN_BLACKLIST_REDIS_DB: int = 1
+    TOKEN_BLACKLIST_CLEANUP_INTERVAL: int = 3600
 
     # [Rate Limiting]
     # Rate limiters configuration is loaded from the YAML file, see `_load_rate_limiters_config` method
     RATE_LIMITERS_CONFIG: RateLimitersConfig | None = None
 
     # [Sentry]
-    SENTRY_URL: str | None = os.getenv(key="SENTRY_URL")
+    SENTRY_URL: str | None = None
 
     # [Logging]
-    SENSITIVE_PARAMS: set[str] = set(
-        os.getenv(key="SENSITIVE_PARAMS", default="password,secret,api_key").split(",")
-    )
+    SENSITIVE_PARAMS: set[str] = {"password", "secret", "api_key"}
+
+    @model_validator(mode="after")
+    def _derive_settings(self) -> "Configuration":
+        """
+        Fill the settings computed from other settings, unless the environment sets them
+        """
+        env = self.ENV.lower()
+        if self.IS_PROD is None:
+            self.IS_PROD = env == "prod"
+        if self.IS_DEV is None:
+            self.IS_DEV = env not in ["prod", "stg"]
+        if self.BASE_URL is None:
+            self.BASE_URL = f"https://{self.APP_FQDN}" if not self.IS_DEV else f"http://{self.APP_FQDN}"
+        credentials = f"{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
+        if self.SQLALCHEMY_DATABASE_URI is None:
+            self.SQLALCHEMY_DATABASE_URI = f"postgresql://{credentials}"
+        if self.ASYNC_DATABASE_URL is None:
+            self.ASYNC_DATABASE_URL = f"postgresql+asyncpg://{credentials}"
+        return self
 
     @model_validator(mode="after")
     def _load_rate_limiters_config(self) -> "Configuration":
@@ -191,7 +211,7 @@ class Configuration(BaseSettings):
             try:
                 rate_limiters_path: Path = Path(candidate_path)
                 if rate_limiters_path.exists():
-                    config_dict = yaml.safe_load(rate_limiters_path.read_text())
+                    config_dict = _read_rate_limiters_yaml(rate_limiters_path)
                     self.RATE_LIMITERS_CONFIG = RateLimitersConfig(**config_dict)
                     logger = logging.getLogger(self.APP_NAME)
                     logger.info(f"Rate limiters config loaded from {candidate_path}")
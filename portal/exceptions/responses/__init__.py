@@ -1,26 +1,46 @@
 """
 Exception responses
 """
-from .auth import InvalidTokenException, UnauthorizedException
-from .base import (
-    ApiBaseException,
-    BadRequestException,
-    ConflictErrorException,
-    EntityTooLargeException,
-    NotFoundException,
-    NotImplementedException,
-    ParamError,
-)
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "ApiBaseException",
-    "BadRequestException",
-    "ConflictErrorException",
-    "EntityTooLargeException",
-    "InvalidTokenException",
-    "NotFoundException",
-    "NotImplementedException",
-    "ParamError",
-    "UnauthorizedException",
-]
+if TYPE_CHECKING:
+    from .auth import InvalidTokenException, UnauthorizedException
+    from .base import (
+        ApiBaseException,
+        BadRequestException,
+        ConflictErrorException,
+        EntityTooLargeException,
+        NotFoundException,
+        NotImplementedException,
+        ParamError,
+    )
 
+# Exported name -> submodule, the submodule is only imported on first access
+_EXPORTS = {
+    "ApiBaseException": ".base",
+    "BadRequestException": ".base",
+    "ConflictErrorException": ".base",
+    "EntityTooLargeException": ".base",
+    "InvalidTokenException": ".auth",
+    "NotFoundException": ".base",
+    "NotImplementedException": ".base",
+    "ParamError": ".base",
+    "UnauthorizedException": ".auth",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups don't go through __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -13,6 +13,8 @@ class InvalidTokenException(ApiBaseException):
     Invalid Token Exception
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         detail: str = "Invalid authorization token",
@@ -32,6 +34,8 @@ class UnauthorizedException(ApiBaseException):
     Unauthorized Exception
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         detail: Any = "Unauthorized",
@@ -50,6 +54,9 @@ class RefreshTokenInvalidException(UnauthorizedException):
     """
     Refresh Token Invalid Exception
     """
+
+    __slots__ = ()
+
     def __init__(
         self,
         detail: Any = "Refresh token invalid",
@@ -68,6 +75,9 @@ class ForbiddenException(ApiBaseException):
     Forbidden Exception
     status_code: 403
     """
+
+    __slots__ = ()
+
     def __init__(
         self,
         detail: str = "Forbidden",
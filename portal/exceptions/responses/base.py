@@ -28,6 +28,8 @@ class APIException(HTTPException):
 class ApiBaseException(HTTPException):
     """API Base Exception"""
 
+    __slots__ = ("debug_detail",)
+
     def __init__(
         self,
         status_code: int,
@@ -49,19 +51,22 @@ class ApiBaseException(HTTPException):
 class BadRequestException(ApiBaseException):
     """Bad Request Exception"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         detail: str | None = None,
         headers: dict[str, Any] | None = None,
         **kwargs
     ):
-        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail, headers=headers)
-        self.debug_detail = kwargs.pop('debug_detail', None)
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail, headers=headers, **kwargs)
 
 
 class ParamError(BadRequestException):
     """Param Error"""
 
+    __slots__ = ()
+
 
 class NotFoundException(ApiBaseException):
     """
@@ -69,14 +74,15 @@ class NotFoundException(ApiBaseException):
     status_code: 404
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         detail: str,
         headers: dict[str, Any] | None = None,
         **kwargs
     ):
-        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail, headers=headers)
-        self.debug_detail = kwargs.pop('debug_detail', None)
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail, headers=headers, **kwargs)
 
 
 class ConflictErrorException(ApiBaseException):
@@ -85,14 +91,15 @@ class ConflictErrorException(ApiBaseException):
     status_code: 409
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         detail: str,
         headers: dict[str, Any] | None = None,
         **kwargs
     ):
-        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail, headers=headers)
-        self.debug_detail = kwargs.pop('debug_detail', None)
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail, headers=headers, **kwargs)
 
 
 class EntityTooLargeException(ApiBaseException):
@@ -101,14 +108,15 @@ class EntityTooLargeException(ApiBaseException):
     status_code: 413
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         detail: str = "Uploaded file size exceeds the limit",
         headers: dict[str, Any] | None = None,
         **kwargs
     ):
-        super().__init__(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail, headers=headers)
-        self.debug_detail = kwargs.pop('debug_detail', None)
+        super().__init__(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail, headers=headers, **kwargs)
 
 
 class NotImplementedException(ApiBaseException):
@@ -117,12 +125,13 @@ class NotImplementedException(ApiBaseException):
     status_code: 501
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         detail: str,
         headers: dict[str, Any] | None = None,
         **kwargs
     ):
-        super().__init__(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=detail, headers=headers)
-        self.debug_detail = kwargs.pop('debug_detail', None)
+        super().__init__(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=detail, headers=headers, **kwargs)
 
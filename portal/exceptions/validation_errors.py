@@ -7,40 +7,50 @@ class ValidationError(Exception):
 
 class ConvertError(ValidationError):
     def __init__(self, value: Any, except_type: Any):
-        super().__init__(f'Attempt to convert "{value}" to {except_type} type failed')
+        # The message is only formatted when the error is actually printed
+        super().__init__(value, except_type)
+        self.value = value
+        self.except_type = except_type
 
+    def __str__(self):
+        return f'Attempt to convert "{self.value}" to {self.except_type} type failed'
 
-class IntError(ValidationError):
-    def __init__(self, value: Any):
-        super().__init__(f'Attempt to convert "{value}" to int type failed')
 
+class _TypeConvertError(ValidationError):
+    """Conversion to a fixed type failed, type_name is set by each subclass"""
+    type_name: str
 
-class FloatError(ValidationError):
     def __init__(self, value: Any):
-        super().__init__(f'Attempt to convert "{value}" to float type failed')
+        super().__init__(value)
+        self.value = value
 
+    def __str__(self):
+        return f'Attempt to convert "{self.value}" to {self.type_name} type failed'
 
-class BoolError(ValidationError):
-    def __init__(self, value: Any):
-        super().__init__(f'Attempt to convert "{value}" to bool type failed')
 
+class IntError(_TypeConvertError):
+    type_name = "int"
 
-class DateError(ValidationError):
-    def __init__(self, value: Any):
-        super().__init__(f'Attempt to convert "{value}" to date type failed')
 
+class FloatError(_TypeConvertError):
+    type_name = "float"
 
-class DateTimeError(ValidationError):
-    def __init__(self, value: Any):
-        super().__init__(f'Attempt to convert "{value}" to datetime type failed')
 
+class BoolError(_TypeConvertError):
+    type_name = "bool"
 
-class UUIDError(ValidationError):
-    def __init__(self, value: Any):
-        super().__init__(f'Attempt to convert "{value}" to uuid type failed')
 
+class DateError(_TypeConvertError):
+    type_name = "date"
+
+
+class DateTimeError(_TypeConvertError):
+    type_name = "datetime"
+
+
+class UUIDError(_TypeConvertError):
+    type_name = "uuid"
 
-class ListError(ValidationError):
-    def __init__(self, value: Any):
-        super().__init__(f'Attempt to convert "{value}" to list type failed')
 
+class ListError(_TypeConvertError):
+    type_name = "list"
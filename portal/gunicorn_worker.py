@@ -0,0 +1,9 @@
+"""
+Gunicorn worker classes
+"""
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopWorker(UvicornWorker):
+    """Uvicorn worker pinned to the uvloop event loop and the httptools HTTP parser"""
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "loop": "uvloop", "http": "httptools"}
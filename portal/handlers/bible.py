@@ -2,11 +2,16 @@
 BibleHandler
 """
 
+import base64
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+import orjson
+import sqlalchemy as sa
+
 from portal.config import settings
-from portal.exceptions.responses import NotFoundException
+from portal.exceptions.responses import NotFoundException, ParamError
+from portal.libs.consts.cache_keys import CacheExpiry, bible_books_key, bible_versions_key
 from portal.libs.database import RedisPool, Session
 from portal.libs.decorators.sentry_tracer import distributed_trace
 from portal.models import BibleBook, BibleVerse, BibleVersion
@@ -25,6 +30,44 @@ if TYPE_CHECKING:
     from redis.asyncio import Redis
 
 
+def _encode_search_cursor(result: BibleSearchResult, total: int) -> str:
+    """
+    Opaque keyset cursor from the search ordering columns of the last result, carrying the search total
+    :param result:
+    :param total:
+    :return:
+    """
+    key = [result.youversion_bible_id, result.book_sequence, result.chapter, result.verse, total]
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode()
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _decode_search_cursor(cursor: str) -> tuple[list, int]:
+    """
+    Search ordering columns and total of a cursor made by _encode_search_cursor
+    :param cursor:
+    :return:
+    """
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except ValueError:
+        raise ParamError("Invalid cursor")
+    if not isinstance(key, list) or len(key) != 5:
+        raise ParamError("Invalid cursor")
+    youversion_bible_id, book_sequence, chapter, verse, total = key
+    # The values are compared against typed columns, a mismatch would fail in the database instead
+    if (
+        not isinstance(youversion_bible_id, str)
+        or not (_is_int(book_sequence) or isinstance(book_sequence, float))
+        or not all(_is_int(value) for value in (chapter, verse, total))
+    ):
+        raise ParamError("Invalid cursor")
+    return [youversion_bible_id, book_sequence, chapter, verse], total
+
+
 class BibleHandler:
     """BibleHandler"""
 
@@ -43,6 +86,10 @@ class BibleHandler:
         :param language: Optional language filter (e.g., 'zh-TW', 'zh-CN')
         :return:
         """
+        key = bible_versions_key(language or "all")
+        if cached := await self._redis.get(key):
+            return BibleVersionList.model_validate_json(cached)
+
         query = self._session.select(
             BibleVersion.id,
             BibleVersion.youversion_bible_id,
@@ -63,7 +110,9 @@ class BibleHandler:
             BibleVersion.language_tag, BibleVersion.youversion_bible_id
         ).fetch(as_model=BibleVersionBase)
 
-        return BibleVersionList(versions=versions)
+        result = BibleVersionList(versions=versions)
+        await self._redis.set(key, result.model_dump_json(), ex=CacheExpiry.DAY)
+        return result
 
     @distributed_trace()
     async def get_books(self, bible_version_id: UUID) -> BibleBookList:
@@ -72,19 +121,13 @@ class BibleHandler:
         :param bible_version_id: Bible version ID (UUID)
         :return:
         """
-        # Verify version exists and is active
-        version_exists = await (
-            self._session.select(BibleVersion.id)
-            .where(BibleVersion.id == bible_version_id)
-            .where(BibleVersion.is_active == True)  # noqa
-            .fetchval()
-        )
-        if not version_exists:
-            raise NotFoundException(
-                detail=f"Bible version {bible_version_id} not found or inactive"
-            )
+        key = bible_books_key(str(bible_version_id))
+        if cached := await self._redis.get(key):
+            return BibleBookList.model_validate_json(cached)
 
-        books: list[BibleBookBase] = await (
+        # Books of an active version only, joining the version saves a separate existence query.
+        # Ordered by canon first, so fetchgroup yields each testament in sequence order
+        book_groups = await (
             self._session.select(
                 BibleBook.id,
                 BibleBook.book_code,
@@ -95,16 +138,32 @@ class BibleHandler:
                 BibleBook.sequence,
                 BibleBook.chapter_count,
             )
-            .where(BibleBook.bible_version_id == bible_version_id)
-            .order_by(BibleBook.sequence)
-            .fetch(as_model=BibleBookBase)
+            .join(BibleVersion, BibleBook.bible_version_id == BibleVersion.id)
+            .where(BibleVersion.id == bible_version_id)
+            .where(BibleVersion.is_active == True)  # noqa
+            .order_by([BibleBook.canon, BibleBook.sequence])
+            .fetchgroup("canon", as_model=BibleBookBase)
         )
+        books_by_canon: dict[str, list[BibleBookBase]] = {canon: list(group) for canon, group in book_groups}
+        if not books_by_canon:
+            # Rare path: tell a missing or inactive version apart from one without books
+            version_exists = await (
+                self._session.select(BibleVersion.id)
+                .where(BibleVersion.id == bible_version_id)
+                .where(BibleVersion.is_active == True)  # noqa
+                .fetchval()
+            )
+            if not version_exists:
+                raise NotFoundException(
+                    detail=f"Bible version {bible_version_id} not found or inactive"
+                )
 
-        # Split into old and new testament
-        old_testament = [book for book in books if book.canon == "old_testament"]
-        new_testament = [book for book in books if book.canon == "new_testament"]
-
-        return BibleBookList(old_testament=old_testament, new_testament=new_testament)
+        result = BibleBookList(
+            old_testament=books_by_canon.get("old_testament", []),
+            new_testament=books_by_canon.get("new_testament", []),
+        )
+        await self._redis.set(key, result.model_dump_json(), ex=CacheExpiry.WEEK)
+        return result
 
     @distributed_trace()
     async def get_chapter(
@@ -118,12 +177,12 @@ class BibleHandler:
         :param chapter: Chapter number
         :return:
         """
-        # Get book info with version info
+        # Get book info with version info, labelled as the BibleChapterDetail fields
         book_with_version = await (
             self._session.select(
-                BibleBook.id,
+                BibleBook.id.label("book_id"),
                 BibleBook.book_code,
-                BibleBook.title,
+                BibleBook.title.label("book_name"),
                 BibleVersion.id.label("bible_version_id"),
                 BibleVersion.youversion_bible_id,
                 BibleVersion.localized_title.label("bible_title"),
@@ -151,16 +210,7 @@ class BibleHandler:
             .fetch(as_model=BibleVerseBase)
         )
 
-        return BibleChapterDetail(
-            bible_version_id=book_with_version["bible_version_id"],
-            youversion_bible_id=book_with_version["youversion_bible_id"],
-            bible_title=book_with_version["bible_title"],
-            book_id=book_with_version["id"],
-            book_code=book_with_version["book_code"],
-            book_name=book_with_version["title"],
-            chapter=chapter,
-            verses=verses,
-        )
+        return BibleChapterDetail(**book_with_version, chapter=chapter, verses=verses)
 
     @distributed_trace()
     async def search_verses(
@@ -170,6 +220,7 @@ class BibleHandler:
         book_id: UUID | None = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> BibleSearchResponse:
         """
         Search bible verses
@@ -177,7 +228,8 @@ class BibleHandler:
         :param bible_version_id: Optional bible version ID filter (UUID)
         :param book_id: Optional book ID filter (UUID)
         :param limit: Result limit
-        :param offset: Result offset
+        :param offset: Result offset, ignored when cursor is given
+        :param cursor: next_cursor of the previous page, continues right after its last result
         :return:
         """
         # Build query - join through book to get version info
@@ -192,6 +244,7 @@ class BibleHandler:
                 BibleVerse.chapter,
                 BibleVerse.verse,
                 BibleVerse.content,
+                BibleBook.sequence.label("book_sequence"),
             )
             .join(BibleBook, BibleVerse.book_id == BibleBook.id)
             .join(BibleVersion, BibleBook.bible_version_id == BibleVersion.id)
@@ -204,25 +257,40 @@ class BibleHandler:
         if book_id:
             query = query.where(BibleVerse.book_id == book_id)
 
-        # Get total count
-        total = await query.count()
+        if cursor:
+            # Keyset pagination: continue after the cursor row instead of scanning and discarding offset rows
+            after, total = _decode_search_cursor(cursor)
+            offset = 0
+            sort_key = sa.tuple_(BibleVersion.youversion_bible_id, BibleBook.sequence, BibleVerse.chapter, BibleVerse.verse)
+            query = query.where(sort_key > sa.tuple_(*after))
+        else:
+            total = None
 
         # Get results
         results: list[BibleSearchResult] = await (
-            query.order_by(
+            query.order_by([
                 BibleVersion.youversion_bible_id,
                 BibleBook.sequence,
                 BibleVerse.chapter,
                 BibleVerse.verse,
-            )
+            ])
             .limit(limit)
             .offset(offset)
             .fetch(as_model=BibleSearchResult)
         )
 
+        if total is None:
+            # A short page is the last one, so the total is known without counting.
+            # An empty page past the first can't tell how many rows come before it.
+            if len(results) < limit and (results or offset == 0):
+                total = offset + len(results)
+            else:
+                total = await query.count()
+
         return BibleSearchResponse(
             results=results,
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=_encode_search_cursor(results[-1], total) if len(results) == limit else None,
         )
@@ -7,7 +7,7 @@ from uuid import UUID
 
 from portal.config import settings
 from portal.exceptions.responses import UnauthorizedException
-from portal.libs.consts.cache_keys import CacheKeys
+from portal.libs.consts.cache_keys import permission_key
 from portal.libs.contexts.user_context import get_user_context
 from portal.libs.database import RedisPool
 from portal.libs.decorators.sentry_tracer import distributed_trace
@@ -22,22 +22,18 @@ class PermissionChecker:
     def __init__(self, redis_client: RedisPool):
         self._redis: Redis = redis_client.create(db=settings.REDIS_DB)
 
-    @distributed_trace()
-    async def has_permission(
-        self, permission_code: str, user_id: UUID | None = None
-    ) -> bool:
+    @staticmethod
+    def _resolve_permission_key(user_id: UUID | None) -> str | None:
         """
-        Check if user has specific permission
-        Permission is checked against Redis cache only (single source of truth)
-        :param permission_code: Permission code (e.g., "user:read")
+        Resolve the user's permission hash key once per check
         :param user_id: User ID, if None, get from context
-        :return: True if user has permission
+        :return: Permission key, or None for a superuser (has all permissions)
         """
         user_context = get_user_context()
 
         # Superuser has all permissions
         if user_context.is_superuser:
-            return True
+            return None
 
         # Get user_id from context if not provided
         if user_id is None:
@@ -46,9 +42,25 @@ class PermissionChecker:
         if not user_id:
             raise UnauthorizedException(detail="User not authenticated")
 
+        return permission_key(str(user_id))
+
+    @distributed_trace()
+    async def has_permission(
+        self, permission_code: str, user_id: UUID | None = None
+    ) -> bool:
+        """
+        Check if user has specific permission
+        Permission is checked against Redis cache only (single source of truth)
+        :param permission_code: Permission code (e.g., "user:read")
+        :param user_id: User ID, if None, get from context
+        :return: True if user has permission
+        """
+        key = self._resolve_permission_key(user_id)
+        if key is None:
+            return True
+
         # Check permission cache (using hash field)
         # Redis cache is the single source of truth for permissions
-        key = CacheKeys(resource="permission").add_attribute(str(user_id)).build()
         return await self._redis.hexists(key, permission_code)
 
     @distributed_trace()
@@ -61,10 +73,14 @@ class PermissionChecker:
         :param user_id: User ID, if None, get from context
         :return: True if user has any permission
         """
-        for permission_code in permission_codes:
-            if await self.has_permission(permission_code, user_id):
-                return True
-        return False
+        if not permission_codes:
+            return False
+        key = self._resolve_permission_key(user_id)
+        if key is None:
+            return True
+        # One HMGET for every code, a missing field comes back as None
+        values = await self._redis.hmget(key, permission_codes)
+        return any(value is not None for value in values)
 
     @distributed_trace()
     async def has_all_permissions(
@@ -76,10 +92,13 @@ class PermissionChecker:
         :param user_id: User ID, if None, get from context
         :return: True if user has all permissions
         """
-        for permission_code in permission_codes:
-            if not await self.has_permission(permission_code, user_id):
-                return False
-        return True
+        if not permission_codes:
+            return True
+        key = self._resolve_permission_key(user_id)
+        if key is None:
+            return True
+        values = await self._redis.hmget(key, permission_codes)
+        return all(value is not None for value in values)
 
     @distributed_trace()
     async def get_user_permissions(self, user_id: UUID | None = None) -> list[str]:
@@ -99,9 +118,6 @@ class PermissionChecker:
 
         # Get permissions from cache (hash keys)
         # Redis cache is the single source of truth for permissions
-        key = CacheKeys(resource="permission").add_attribute(str(user_id)).build()
-        permission_codes = await self._redis.hkeys(key)
-        return [
-            code.decode() if isinstance(code, bytes) else code
-            for code in permission_codes
-        ]
+        key = permission_key(str(user_id))
+        # RedisPool clients decode responses, so HKEYS already returns str
+        return await self._redis.hkeys(key)
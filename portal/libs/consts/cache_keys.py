@@ -1,8 +1,12 @@
 """
 Constants for Cache keys
 """
+from functools import lru_cache
+
 from portal.config import settings
 
+APP_NAME = settings.APP_NAME
+
 
 class CacheExpiry:
     """
@@ -18,16 +22,17 @@ class CacheExpiry:
 class CacheKeys:
 
     def __init__(self, resource: str):
-        self._app_name = settings.APP_NAME
+        self._app_name = APP_NAME
         self.resource = resource
-        self.attributes = []
+        # The key is grown in place by add_attribute, build() only returns it
+        self._key = f"{self._app_name}:{resource}:"
 
     def build(self) -> str:
         """
         Build cache key
         :return:
         """
-        return f"{self._app_name}:{self.resource}:{''.join(self.attributes)}"
+        return self._key
 
     def add_attribute(self, attribute: str, separator: str = ":") -> 'CacheKeys':
         """
@@ -36,5 +41,46 @@ class CacheKeys:
         :param separator:
         :return:
         """
-        self.attributes.extend([attribute, separator])
+        self._key += attribute + separator
         return self
+
+
+# Key helpers for the hot paths, same output as the matching CacheKeys chain
+
+
+@lru_cache(maxsize=8192)
+def make_key(resource: str, attribute: str) -> str:
+    """
+    Key of a resource with one attribute, memoized since the same users and resources keep coming back
+    :param resource:
+    :param attribute:
+    :return:
+    """
+    return f"{APP_NAME}:{resource}:{attribute}:"
+
+
+def permission_key(user_id: str) -> str:
+    """
+    Permission hash of a user
+    :param user_id:
+    :return:
+    """
+    return make_key("permission", user_id)
+
+
+def bible_versions_key(language: str) -> str:
+    """
+    Cached Bible version list of a language filter
+    :param language:
+    :return:
+    """
+    return make_key("bible:versions", language)
+
+
+def bible_books_key(bible_version_id: str) -> str:
+    """
+    Cached book list of a Bible version
+    :param bible_version_id:
+    :return:
+    """
+    return make_key("bible:books", bible_version_id)
@@ -32,30 +32,15 @@ class Permission:
     """
 
     class PermissionCode:
-        """Internal class for generating permission codes"""
+        """Internal class holding the permission codes of a resource, built once at import"""
+        __slots__ = ("all", "read", "create", "modify", "delete")
 
         def __init__(self, resource_value: str):
-            self._resource_value = resource_value
-
-        @property
-        def all(self):
-            return f"{self._resource_value}:*"
-
-        @property
-        def read(self):
-            return f"{self._resource_value}:{Verb.READ.value}"
-
-        @property
-        def create(self):
-            return f"{self._resource_value}:{Verb.CREATE.value}"
-
-        @property
-        def modify(self):
-            return f"{self._resource_value}:{Verb.MODIFY.value}"
-
-        @property
-        def delete(self):
-            return f"{self._resource_value}:{Verb.DELETE.value}"
+            self.all = f"{resource_value}:*"
+            self.read = f"{resource_value}:{Verb.READ.value}"
+            self.create = f"{resource_value}:{Verb.CREATE.value}"
+            self.modify = f"{resource_value}:{Verb.MODIFY.value}"
+            self.delete = f"{resource_value}:{Verb.DELETE.value}"
 
     # System resources
     SYSTEM_LOG = PermissionCode(Resource.SYSTEM_LOG.value)
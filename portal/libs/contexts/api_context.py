@@ -2,19 +2,16 @@
 API Context
 """
 from contextvars import ContextVar, Token
-
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 from portal.schemas.auth import TokenPayload
 
 auth_context = ContextVar("APIContext")
 
 
-class APIContext(BaseModel):
+@dataclass(slots=True)
+class APIContext:
     """API Context"""
-    model_config = {
-        "arbitrary_types_allowed": True
-    }
     token: str | None = None
     token_payload: TokenPayload | None = None
     uid: str | None = None
@@ -2,11 +2,11 @@
 Request Context (per-request)
 """
 from contextvars import ContextVar, Token
+from dataclasses import dataclass
 
-from pydantic import BaseModel
 
-
-class RequestContext(BaseModel):
+@dataclass(slots=True)
+class RequestContext:
     """Per-request HTTP information"""
 
     ip: str | None = None
@@ -34,12 +34,3 @@ def get_request_context() -> RequestContext:
     Get current request's request context.
     """
     return request_context_var.get()
-
-
-def reset_request_context(token) -> None:
-    """
-    Reset the request context for current request.
-    :param token:
-    :return:
-    """
-    request_context_var.reset(token)
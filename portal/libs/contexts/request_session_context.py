@@ -17,7 +17,3 @@ def get_request_session() -> Session | None:
     return _request_session_ctx.get()
 
 
-def reset_request_session(token) -> None:
-    _request_session_ctx.reset(token)
-
-
@@ -2,15 +2,16 @@
 User Context (per-request)
 """
 from contextvars import ContextVar, Token
+from dataclasses import dataclass, replace
 from datetime import datetime
+from typing import Final
 from uuid import UUID
 
-from pydantic import BaseModel
-
 from portal.libs.consts.enums import Gender
 
 
-class UserContext(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UserContext:
     """Per-request user information"""
     user_id: UUID | None = None
     phone_number: str | None = None
@@ -31,7 +32,15 @@ class UserContext(BaseModel):
     username: str | None = None
 
 
-user_context_var: ContextVar[UserContext] = ContextVar("UserContext")
+# Shared by every request that never authenticates, so anonymous requests don't set the ContextVar at all.
+# It must never be mutated, update_user_context replaces it with a copy instead
+ANON_USER_CONTEXT: Final = UserContext()
+
+user_context_var: ContextVar[UserContext] = ContextVar("UserContext", default=ANON_USER_CONTEXT)
+# Bound once, these run on every request
+_ctx_get = user_context_var.get
+_ctx_set = user_context_var.set
+_ctx_reset = user_context_var.reset
 
 
 def set_user_context(context: UserContext) -> Token:
@@ -39,17 +48,32 @@ def set_user_context(context: UserContext) -> Token:
     Set the user context for current request.
     Prefer initializing this once in middleware and mutate thereafter.
     """
-    return user_context_var.set(context)
+    return _ctx_set(context)
 
 
-def get_user_context() -> UserContext | None:
+def get_user_context() -> UserContext:
     """
-    Get current request's user context. Middleware should have set it.
+    Get current request's user context, ANON_USER_CONTEXT unless middleware has set one.
+    """
+    return _ctx_get()
+
+
+def update_user_context(**fields) -> UserContext:
+    """
+    Update fields of the current request's user context in place.
+    The context object is mutable per request, so no new UserContext is allocated;
+    one is only created (and set) when the request still has the shared anonymous context.
+    :param fields: UserContext field values
+    :return:
     """
-    try:
-        return user_context_var.get()
-    except LookupError:
-        return None
+    context = _ctx_get()
+    if context is ANON_USER_CONTEXT:
+        context = replace(ANON_USER_CONTEXT, **fields)
+        _ctx_set(context)
+        return context
+    for name, value in fields.items():
+        setattr(context, name, value)
+    return context
 
 
 def reset_user_context(token) -> None:
@@ -58,4 +82,4 @@ def reset_user_context(token) -> None:
     :param token:
     :return:
     """
-    user_context_var.reset(token)
+    _ctx_reset(token)
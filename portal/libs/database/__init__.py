@@ -1,13 +1,33 @@
 """
 Top-level package for database.
 """
-from .aio_orm import Session
-from .aio_pg import PostgresConnection
-from .aio_redis import RedisPool
-
-__all__ = [
-    "PostgresConnection",
-    "PostgresConnection",
-    "RedisPool",
-    "Session",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .aio_orm import Session
+    from .aio_pg import PostgresConnection
+    from .aio_redis import RedisPool
+
+# Exported name -> submodule, so code that only needs Redis doesn't import SQLAlchemy/asyncpg
+_EXPORTS = {
+    "PostgresConnection": ".aio_pg",
+    "RedisPool": ".aio_redis",
+    "Session": ".aio_orm",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups don't go through __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,10 @@ import re
 import uuid
 from collections.abc import Callable
 from datetime import date, datetime
+from decimal import Decimal
 from enum import Enum, StrEnum
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from typing import TYPE_CHECKING, Any, TypeVar, overload
 
 import asyncpg
@@ -20,6 +23,7 @@ from sqlalchemy.orm import Query, aliased
 from sqlalchemy.sql import FromClause
 from sqlalchemy.sql.dml import Delete, Insert, Update
 from sqlalchemy.sql.selectable import ScalarSelect
+from sqlalchemy.util import LRUCache
 
 from portal.config import settings
 from portal.libs.database.aio_pg import ConnectionType, PostgresConnection
@@ -32,6 +36,18 @@ if TYPE_CHECKING:
 
 dialect = postgresql.dialect()
 
+# Compiled statements by SQLAlchemy cache key, so repeated query shapes skip compilation
+_compiled_cache = LRUCache(1024)
+
+# Plain multi-row inserts with at least this many rows are loaded with COPY
+COPY_MIN_ROWS = 50
+
+# Column carrying the windowed total of fetchpages
+PAGE_TOTAL_LABEL = "page_total__"
+
+# pyformat bind parameter rendered by the postgresql dialect, e.g. %(name_1)s
+_PARAM_RE = re.compile(r"%\(([^)]+)\)s")
+
 __all__ = ["ISession", "Session"]
 
 T = TypeVar("T")
@@ -45,6 +61,7 @@ class FetchMethod(StrEnum):
     FETCH = "fetch"
     FETCH_VAL = "fetch_val"
     FETCH_ROW = "fetch_row"
+    FETCH_RECORDS = "fetch_records"
 
 
 def _format_value(value):
@@ -55,21 +72,121 @@ def _format_dict(item: Record, as_model: type[BaseModel] | None = None):
     if item is None:
         return item
     if as_model:
-        return as_model.model_validate(dict(item))
+        # Rows come from our own database, skip pydantic validation
+        return as_model.model_construct(**item)
     data = {}
-    for name, value in dict(item).items():
+    for name, value in item.items():
         if isinstance(value, (list, tuple)):
-            data[name] = [Converter.format_value(item) for item in value]
+            data[name] = [Converter.format_value(v) for v in value]
         else:
             data[name] = Converter.format_value(value)
     return data
 
 
+def _format_list(value):
+    if value is None:
+        return None
+    return [Converter.format_value(v) for v in value]
+
+
+def _format_any(value):
+    if isinstance(value, (list, tuple)):
+        return _format_list(value)
+    return Converter.format_value(value)
+
+
+def _column_formatter(value) -> Callable | None:
+    """
+    Formatter for a result column, picked from one of its values
+    :param value:
+    :return: None when the column's values are returned as is
+    """
+    if value is None:
+        # Type unknown from a null, later values may be arrays or scalars
+        return _format_any
+    if isinstance(value, (list, tuple)):
+        return _format_list
+    if isinstance(value, (date, Decimal)):
+        return _format_value
+    return None
+
+
+def _format_records(rows: list[Record]) -> list[dict]:
+    """
+    Format fetched rows as dicts, choosing each column's formatter once per result instead of per value
+    :param rows:
+    :return:
+    """
+    if not rows:
+        return []
+    first = rows[0]
+    plan = tuple(zip(first.keys(), map(_column_formatter, first.values())))
+    if not any(formatter for _, formatter in plan):
+        return [dict(row.items()) for row in rows]
+    return [{name: formatter(value) if formatter else value for (name, formatter), value in zip(plan, row.values())} for row in rows]
+
+
+def _compile_statement(statement) -> tuple[str, str, tuple[str, ...], dict]:
+    """
+    Compile a statement with the shared dialect, reusing the compiled form of same-shaped statements
+    :param statement:
+    :return: pyformat sql (for echo), $n sql, parameter names in $n order, parameter values
+    """
+    cache_key = statement._generate_cache_key()  # noqa
+    entry = None if cache_key is None else _compiled_cache.get(cache_key.key)
+    if entry is None:
+        compiled: PGCompiler = statement.compile(dialect=dialect, cache_key=cache_key)
+        if cache_key is None or compiled.post_compile_params or compiled.literal_execute_params:
+            # Expanding IN lists render differently per call, compile them fully every time
+            compiled = statement.compile(dialect=dialect, compile_kwargs={"render_postcompile": True})
+            cache_key = None
+        data = compiled.params
+        raw_sql = str(compiled)
+        positions: dict[str, str] = {}
+
+        def _to_numeric(match: re.Match) -> str:
+            name = match.group(1)
+            if name not in data:
+                return match.group(0)
+            if name not in positions:
+                positions[name] = f"${len(positions) + 1}"
+            return positions[name]
+
+        # One pass over the sql, numbering parameters in the order they appear
+        sql = _PARAM_RE.sub(_to_numeric, raw_sql)
+        names = tuple(positions)
+        if cache_key is None:
+            return raw_sql, sql, names, data
+        _compiled_cache[cache_key.key] = entry = (raw_sql, sql, names, compiled)
+    raw_sql, sql, names, compiled = entry
+    return raw_sql, sql, names, compiled.construct_params(extracted_parameters=cache_key.bindparams)
+
+
 def _format_where(clauses: tuple) -> tuple | ColumnExpressionArgument:
-    Assert.is_not_null(clauses, "clauses")
-    if len(clauses) > 2:
-        raise TypeError("There are too many where condition parameters, please use multiple where for multiple conditions or use or_, and_ for splicing")
-    return condition_clause(clauses[0], clauses[1]) if len(clauses) == 2 else clauses[0]
+    count = len(clauses)
+    if count == 1:
+        return clauses[0]
+    if count == 2:
+        return condition_clause(clauses[0], clauses[1])
+    if not count:
+        raise TypeError("where requires a condition")
+    raise TypeError("There are too many where condition parameters, please use multiple where for multiple conditions or use or_, and_ for splicing")
+
+
+@lru_cache(maxsize=256)
+def _order_columns(table) -> dict[str, Any]:
+    """
+    Orderable attributes of a mapped class or table by name, collected once per table
+    :param table:
+    :return:
+    """
+    if table is None:
+        return {}
+    mapper = getattr(sa.inspect(table, raiseerr=False), "mapper", None)
+    if mapper is not None:
+        return {name: getattr(table, name) for name in mapper.all_orm_descriptors.keys()}
+    columns = getattr(table, "c", None)
+    return dict(columns.items()) if columns is not None else {}
 
 
 def _get_order_by(tables: type[sa.Table] | list[type[sa.Table]] | None, order_by: str, descending=True, **map_columns):
@@ -98,25 +215,23 @@ def _get_order_by(tables: type[sa.Table] | list[type[sa.Table]] | None, order_by
                 col = column
         else:
             for table in tables:
-                if hasattr(table, order_by):
-                    col = getattr(table, order_by)
+                col = _order_columns(table).get(order_by)
+                if col is not None:
                     break
     if not tables and not map_columns:
         raise ValueError("Table and map_columns cannot be empty at the same time")
+    first_columns = _order_columns(tables[0])
     if col is None and not ordered_items:
         descending = True
-        col = tables[0].sequence if hasattr(tables[0], "sequence") else tables[0].created_at
+        col = first_columns["sequence"] if "sequence" in first_columns else first_columns["created_at"]
 
     if col is not None:
-        if descending:
-            if isinstance(col, str):
-                ordered_items.append(f"{col} desc")
-            else:
-                ordered_items.append(col.desc())
-        else:
-            ordered_items.append(col)
-    if "id" not in ordered_items and hasattr(tables[0], "id"):
-        ordered_items.append(tables[0].id)
+        if isinstance(col, str):
+            # Mapped by name (e.g. a label), keep it an expression rather than a raw order string
+            col = sa.literal_column(col)
+        ordered_items.append(col.desc() if descending else col)
+    if "id" not in ordered_items and "id" in first_columns:
+        ordered_items.append(first_columns["id"])
     return ordered_items
 
 
@@ -124,34 +239,102 @@ class _Insert:
     def __init__(self, insert: PgInsert, session: "Session"):
         self._insert = insert
         self._session = session
+        # Rows of a plain multi-row insert, loaded with COPY by execute() when there are enough of them
+        self._rows: list[dict] | None = None
+        self._copyable = True
 
     def values(self, *args, **kwargs):
         """
         :rtype: _Insert
         """
+        if self._rows is None and self._copyable and len(args) == 1 and not kwargs and isinstance(args[0], list):
+            self._rows = args[0]
+        else:
+            self._rows = None
+            self._copyable = False
         if args and len(args) == 1 and isinstance(args[0], dict):
             self._insert = self._insert.values(**args[0], **kwargs)
             return self
         self._insert = self._insert.values(*args, **kwargs)
         return self
 
+    @property
     def excluded(self):
-        self._insert = self._insert.excluded()
-        return self
+        """
+        EXCLUDED pseudo-table, for `set_` values of on_conflict_do_update
+        """
+        return self._insert.excluded
 
     def on_conflict_do_nothing(self, constraint=None, index_elements=None, index_where=None):
+        self._copyable = False
         self._insert = self._insert.on_conflict_do_nothing(constraint=constraint, index_elements=index_elements, index_where=index_where)
         return self
 
     def on_conflict_do_update(self, constraint=None, index_elements=None, index_where=None, set_=None, where=None):
+        self._copyable = False
         self._insert = self._insert.on_conflict_do_update(constraint=constraint, index_elements=index_elements, index_where=index_where, set_=set_, where=where)
         return self
 
+    def returning(self, *cols):
+        """
+        :rtype: _Insert
+        """
+        self._copyable = False
+        self._insert = self._insert.returning(*cols)
+        return self
+
     async def execute(self):
+        if self._copyable and self._rows and len(self._rows) >= COPY_MIN_ROWS:
+            copy = self._copy_records()
+            if copy is not None:
+                names, records = copy
+                table = self._insert.table
+                return await self._session.copy_records_to_table(table.name, records=records, columns=names, schema_name=table.schema)
         return await self._session.execute(self._insert)
 
+    def _copy_records(self) -> tuple[list[str], list[tuple]] | None:
+        """
+        Columns and records for loading the rows with COPY, with python-side defaults filled and values validated like an INSERT
+        :return: None when the rows can't be copied as is
+        """
+        first = self._rows[0]
+        if not isinstance(first, dict) or not all(isinstance(row, dict) and row.keys() == first.keys() for row in self._rows):
+            return None
+        columns = self._insert.table.columns
+        keys = first.keys()
+        names = list(keys)
+        if not all(isinstance(name, str) and name in columns for name in names):
+            return None
+        defaults = [column for column in columns if column.name not in keys and column.default is not None]
+        if any(not (column.default.is_callable or column.default.is_scalar) for column in defaults):
+            # SQL expression or sequence defaults only exist inside an INSERT
+            return None
+        names.extend(column.name for column in defaults)
+        records = []
+        for row in self._rows:
+            data = dict(row)
+            for column in defaults:
+                data[column.name] = exec_default(column.default)
+            validate(table=self._insert.table, data=data, is_insert=True)
+            records.append(tuple(data[name] for name in names))
+        return names, records
+
+    async def fetch(self, as_model: type[BaseModel] | None = None) -> list[T]:
+        """
+        Rows of the RETURNING clause
+        :param as_model:
+        :return:
+        """
+        return await self._session.fetch(self._insert, as_model=as_model)
+
+    async def fetchrow(self, as_model: type[BaseModel] | None = None) -> T:
+        return await self._session.fetchrow(self._insert, as_model=as_model)
+
+    async def fetchval(self):
+        return await self._session.fetchval(self._insert)
+
     def __str__(self):
-        return str(self._insert.compile(dialect=postgresql.dialect()))
+        return str(self._insert.compile(dialect=dialect))
 
 
 class _Update:
@@ -388,6 +571,10 @@ class _Select:
         return self._select.cte(name, recursive=recursive)
 
     async def fetch(self, as_model: type[BaseModel] | None = None) -> list[T]:
+        """
+        :param as_model:
+        :return:
+        """
         return await self._session.fetch(self._select.statement, as_model=as_model)
 
     async def fetchgroup(self, groupby: str, as_model: type[BaseModel] | None = None):
@@ -400,19 +587,37 @@ class _Select:
 
     async def fetchpages(self, no_order_by: bool = True, as_model: type[BaseModel] | None = None) -> tuple[list[T], int]:
         """
+        Rows of the page and the total count, counted with count(*) OVER () in the same query
         :param as_model:
         :param no_order_by:
         :return:
         """
+        if self._select._distinct:  # noqa
+            # The window is evaluated before DISTINCT, it would count duplicates
+            count = await self._page_count(no_order_by)
+            return await self._session.fetch(self._select.statement, as_model=as_model), count
+        statement = self._select.add_columns(sa.func.count().over().label(PAGE_TOTAL_LABEL)).statement
+        records = await self._session._fetch(FetchMethod.FETCH_RECORDS, statement, ())  # noqa
+        if not records:
+            # An empty page (e.g. offset past the end) carries no total
+            return [], await self._page_count(no_order_by)
+        count = records[0][PAGE_TOTAL_LABEL]
+        if as_model:
+            data = [_format_dict({name: value for name, value in record.items() if name != PAGE_TOTAL_LABEL}, as_model=as_model) for record in records]
+        else:
+            data = _format_records(records)
+            for item in data:
+                item.pop(PAGE_TOTAL_LABEL)
+        return data, count
+
+    async def _page_count(self, no_order_by: bool = True) -> int:
         counter = self._select._clone()  # noqa
         counter = counter.offset(None).limit(None)
         if no_order_by:
             counter._order_by = None
 
         count_stmt = sa.select(sa.func.count(sa.literal_column("*"))).select_from(aliased(counter.subquery()))
-        count = await self._session.fetchval(count_stmt)
-        data = await self._session.fetch(self._select.statement, as_model=as_model)
-        return data, count
+        return await self._session.fetchval(count_stmt)
 
     async def fetchdict(self, key: str, value: str | None = None, as_model: type[BaseModel] | None = None) -> dict:
         """
@@ -436,9 +641,13 @@ class _Select:
         return await self._session.fetchvals(self._select.statement)
 
     async def count(self):
-        col = sa.func.count(sa.literal_column("*"))
-        select = self._select.select_from(col)
-        return await self._session.fetchval(select.statement)
+        """
+        Count the matching rows, ignoring any order_by/limit/offset already applied
+        :return:
+        """
+        counter = self._select.offset(None).limit(None).order_by(None)
+        count_stmt = sa.select(sa.func.count(sa.literal_column("*"))).select_from(aliased(counter.subquery()))
+        return await self._session.fetchval(count_stmt)
 
     def __str__(self):
         return str(self._select)
@@ -502,20 +711,54 @@ def exec_default(default):
     return default.arg
 
 
-def validate(columns: dict, data: dict, is_update: bool = False, is_insert: bool = False):
+# Column type -> (check, convert, error), the first matching type wins
+_TYPE_VALIDATORS = (
+    (Integer, validator.is_int, Converter.to_int, "must be an integer"),
+    ((Numeric, Float), validator.is_number, Converter.to_float, "must be a number"),
+    (Boolean, validator.is_bool, Converter.to_bool, "must be a boolean"),
+    (DateTime, validator.is_datetime, Converter.to_datetime, "must be a date format yyyy-MM-dd HH:mm:ss"),
+    (Date, validator.is_date, Converter.to_date, "must be in the date format yyyy-MM-dd"),
+    (UUID, validator.is_uuid, None, "must be a UUID"),
+)
+
+
+@lru_cache(maxsize=256)
+def _validation_plan(table: sa.Table) -> dict[str, tuple]:
+    """
+    How each column of the table is validated, resolved once per table
+    :param table:
+    :return: column key -> (column, check, convert, error, string max length)
+    """
+    plan = {}
+    for column in table.columns:
+        rule = (column, None, None, None, None)
+        for types, check, convert, error in _TYPE_VALIDATORS:
+            if isinstance(column.type, types):
+                rule = (column, check, convert, error, None)
+                break
+        else:
+            if isinstance(column.type, String):
+                rule = (column, None, str, None, column.type.length)
+        plan[column.key] = rule
+    return plan
+
+
+def validate(table: sa.Table, data: dict, is_update: bool = False, is_insert: bool = False):
     """
     :param is_insert:
     :param is_update:
-    :param columns:
+    :param table:
     :param data:
     :return:
     """
     errors = []
+    plan = _validation_plan(table)
 
     for name, value in data.items():
-        if name not in columns:
+        rule = plan.get(name)
+        if rule is None:
             continue
-        column = columns[name]
+        column, check, convert, error, max_length = rule
         if value is None or value == "":
             if is_update:
                 data[column.name] = exec_default(column.onupdate)
@@ -527,39 +770,16 @@ def validate(columns: dict, data: dict, is_update: bool = False, is_insert: bool
             continue
         if isinstance(value, Enum):
             value = value.value
-        if isinstance(column.type, Integer):
-            if not validator.is_int(value):
-                errors.append(f"The format of the field '{column.name}' is invalid, the value '{value}' must be an integer")
-            else:
-                data[column.name] = Converter.to_int(value)
-        elif isinstance(column.type, (Numeric, Float)):
-            if not validator.is_number(value):
-                errors.append(f"The format of the field '{column.name}' is invalid, the value '{value}' must be a number")
-            else:
-                data[column.name] = Converter.to_float(value)
-        elif isinstance(column.type, Boolean):
-            if not validator.is_bool(value):
-                errors.append(f"The format of the field '{column.name}' is invalid, the value '{value}' must be a boolean")
-            else:
-                data[column.name] = Converter.to_bool(value)
-        elif isinstance(column.type, DateTime):
-            if not validator.is_datetime(value):
-                errors.append(f"The format of the field '{column.name}' is invalid, the value '{value}' must be a date format yyyy-MM-dd HH:mm:ss")
-            else:
-                data[column.name] = Converter.to_datetime(value)
-        elif isinstance(column.type, Date):
-            if not validator.is_date(value):
-                errors.append(f"The format of the field '{column.name}' is invalid, the value '{value}' must be in the date format yyyy-MM-dd")
-            else:
-                data[column.name] = Converter.to_date(value)
-        elif isinstance(column.type, UUID):
-            if not validator.is_uuid(value):
-                errors.append(f"The format of the field '{column.name}' is invalid, the value '{value}' must be a UUID")
-        elif isinstance(column.type, String):
-            s_value = str(value)
-            if column.type and column.type.length and len(s_value) > column.type.length:
+        if check is not None:
+            if not check(value):
+                errors.append(f"The format of the field '{column.name}' is invalid, the value '{value}' {error}")
+            elif convert is not None:
+                data[column.name] = convert(value)
+        elif convert is not None:
+            s_value = convert(value)
+            if max_length and len(s_value) > max_length:
                 errors.append(
-                    f"The format of the field '{column.name}' is invalid, the value '{value}' must be less than or equal to {column.type.length} characters"
+                    f"The format of the field '{column.name}' is invalid, the value '{value}' must be less than or equal to {max_length} characters"
                 )
             data[column.name] = s_value
     if errors:
@@ -594,6 +814,7 @@ class Session(ISession):
         loop: asyncio.AbstractEventLoop | None = None,
         use_poll: bool | None = None,
         postgres_connection: PostgresConnection = None,
+        statement_cache_size: int | None = None,
     ):
         if use_poll is None:
             self._use_pool = settings.DATABASE_POOL
@@ -606,6 +827,9 @@ class Session(ISession):
         if echo is None:
             echo = settings.SQL_ECHO
         self._echo = echo
+        if statement_cache_size is None:
+            statement_cache_size = settings.DATABASE_STATEMENT_CACHE_SIZE
+        self._statement_cache_size = statement_cache_size
         self._is_closed = False
         self._loop = loop or asyncio.get_event_loop()
         self._locker = asyncio.Lock()
@@ -639,13 +863,15 @@ class Session(ISession):
             # logger.debug(f"use poll:{self._use_pool}")
             if self._use_pool:
                 if self._pool is None:
-                    self._pool = await self._postgres_connection.create_connection(connection_type=ConnectionType.POOL, command_timeout=self._timeout)
+                    self._pool = await self._postgres_connection.create_connection(
+                        connection_type=ConnectionType.POOL, command_timeout=self._timeout, statement_cache_size=self._statement_cache_size
+                    )
                 if self._conn is None or self._conn.is_closed():
                     self._conn = await self._pool.acquire(timeout=60)
             else:
                 if self._conn is None or self._conn.is_closed():
                     self._conn = await self._postgres_connection.create_connection(
-                        connection_type=ConnectionType.DEFAULT, command_timeout=self._timeout, loop=self._loop
+                        connection_type=ConnectionType.DEFAULT, command_timeout=self._timeout, loop=self._loop, statement_cache_size=self._statement_cache_size
                     )
             self._is_closed = False
         except asyncpg.InterfaceError as e:
@@ -673,23 +899,14 @@ class Session(ISession):
                     raw_sql = re.sub(rf"\${index}(\D:?)", rf"{convert_literal_value(p)}\g<1>", raw_sql)
                     index += 1
         else:
-            result: PGCompiler = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True})
-            sql = str(result)
-            raw_sql = sql
-            index = 1
-            params = []
+            raw_sql, sql, names, data = _compile_statement(statement)
             is_update = isinstance(statement, Update)
             is_insert = isinstance(statement, Insert)
-            if result.params:
-                data = result.params.copy()
-                if is_update or is_insert:
-                    validate(columns=statement.table.columns, data=data, is_update=is_update, is_insert=is_insert)
-                for name, value in data.items():
-                    sql = sql.replace(f"%({name})s", f"${index}")
-                    if self._echo:
-                        raw_sql = raw_sql.replace(f"%({name})s", convert_literal_value(value))
-                    params.append(value)
-                    index += 1
+            if data and (is_update or is_insert):
+                validate(table=statement.table, data=data, is_update=is_update, is_insert=is_insert)
+            params = [data[name] for name in names]
+            if self._echo:
+                raw_sql = _PARAM_RE.sub(lambda m: convert_literal_value(data[m.group(1)]) if m.group(1) in data else m.group(0), raw_sql)
         if append_statement:
             sql += append_statement
             raw_sql += append_statement
@@ -699,11 +916,17 @@ class Session(ISession):
             logger.debug(str.rjust("", 100, "-"))
         return sql, params
 
+    @property
+    def _is_connected(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
     async def execute(self, statement, *params, append_statement: str | None = None, timeout: float | None = None):
         try:
             await self._locker.acquire()
-            await self._ensure_connection(False)
-            await self._ensure_transaction(False)
+            if not self._is_connected:
+                await self._ensure_connection(False)
+            if self._tx is None:
+                await self._ensure_transaction(False)
             sql, params = self._format_statement(statement, append_statement, *params)
             return await self._conn.execute(sql, *params, timeout=timeout)
         except Exception:
@@ -712,6 +935,18 @@ class Session(ISession):
         finally:
             self._locker.release()
 
+    async def prepare(self, statement: str, *, timeout: float | None = None) -> asyncpg.prepared_stmt.PreparedStatement:
+        """
+        Prepare a statement once on the session connection, inside the session transaction
+        :param statement: SQL with $n placeholders
+        :param timeout:
+        :return:
+        """
+        async with self._locker:
+            await self._ensure_connection(False)
+            await self._ensure_transaction(False)
+            return await self._conn.prepare(statement, timeout=timeout)
+
     def insert(self, table: TableTypes):
         return _Insert(PgInsert(table), self)
 
@@ -738,7 +973,9 @@ class Session(ISession):
                 filtered_columns.append(column)
         return _Select(filtered_columns, table, self)
 
-    async def fetch(self, statement, *params, timeout: float | None = None, as_model: type[BaseModel] | None = None) -> list[T]:
+    async def fetch(
+        self, statement, *params, timeout: float | None = None, as_model: type[BaseModel] | None = None
+    ) -> list[T]:
         """
         :param statement:
         :param params:
@@ -748,7 +985,9 @@ class Session(ISession):
         """
         return await self._fetch(FetchMethod.FETCH, statement, params, timeout=timeout, as_model=as_model)
 
-    async def fetchgroup(self, statement, *params, timeout: float | None = None, groupby: str, as_model: type[BaseModel] | None = None):
+    async def fetchgroup(
+        self, statement, *params, timeout: float | None = None, groupby: str, as_model: type[BaseModel] | None = None
+    ):
         """
 
         :param statement:
@@ -761,9 +1000,7 @@ class Session(ISession):
         import itertools
 
         items = await self.fetch(statement, *params, timeout=timeout, as_model=as_model)
-        if as_model:
-            return itertools.groupby(items, key=lambda item: getattr(item, groupby))
-        return itertools.groupby(items, key=lambda item: item[groupby])
+        return itertools.groupby(items, key=attrgetter(groupby) if as_model else itemgetter(groupby))
 
     async def fetchrow(self, statement, *params, timeout: float | None = None, as_model: type[BaseModel] | None = None):
         return await self._fetch(FetchMethod.FETCH_ROW, statement, params, timeout=timeout, as_model=as_model)
@@ -781,32 +1018,43 @@ class Session(ISession):
         sql, params = self._format_statement(statement, None, *params)
         await self._ensure_connection()
         rows = await self._conn.fetch(sql, *params, timeout=timeout)
-        return [_format_value(item[0]) for item in rows]
+        if not rows:
+            return []
+        values = map(itemgetter(0), rows)
+        formatter = _column_formatter(rows[0][0])
+        return list(values if formatter is None else map(formatter, values))
 
     async def fetchdict(
         self, statement, *params, timeout: float | None = None, key: str, value: str | None = None, as_model: type[BaseModel] | None = None
     ) -> dict:
         Assert.is_not_null(key, "key")
         items = await self.fetch(statement, *params, timeout=timeout, as_model=as_model)
-        results = {}
         if not items:
-            return results
-        for item in items:
-            _key = getattr(item, key) if as_model else item.get(key, None)
-            if value is None:
-                results[_key] = item
-            else:
-                _value = getattr(item, value) if as_model else item.get(value, None)
-                results[_key] = _value
-        return results
+            return {}
+        getter = attrgetter if as_model else itemgetter
+        get_key = getter(key)
+        if value is None:
+            return {get_key(item): item for item in items}
+        get_value = getter(value)
+        return {get_key(item): get_value(item) for item in items}
 
     async def _fetch(
-        self, method: FetchMethod, statement, params, append_statement: str | None = None, timeout: float | None = None, as_model: type[BaseModel] | None = None
+        self,
+        method: FetchMethod,
+        statement,
+        params,
+        append_statement: str | None = None,
+        timeout: float | None = None,
+        as_model: type[BaseModel] | None = None,
     ) -> list[T] | T | dict | str | int:
         try:
             await self._locker.acquire()
             sql, params = self._format_statement(statement, append_statement, *params)
-            await self._ensure_connection(False)
+            if not self._is_connected:
+                await self._ensure_connection(False)
+            if self._tx is None and isinstance(statement, (Insert, Update, Delete)):
+                # DML ... RETURNING writes like execute() does, inside the session transaction
+                await self._ensure_transaction(False)
             match method:
                 case FetchMethod.FETCH_VAL:
                     value = await self._conn.fetchval(sql, *params, timeout=timeout)
@@ -814,8 +1062,12 @@ class Session(ISession):
                 case FetchMethod.FETCH_ROW:
                     value = await self._conn.fetchrow(sql, *params, timeout=timeout)
                     return _format_dict(item=value, as_model=as_model)
+                case FetchMethod.FETCH_RECORDS:
+                    return await self._conn.fetch(sql, *params, timeout=timeout) or []
                 case FetchMethod.FETCH:
                     rows = await self._conn.fetch(sql, *params, timeout=timeout) or []
+                    if not as_model:
+                        return _format_records(rows)
                     return [_format_dict(item=item, as_model=as_model) for item in rows]
                 case _:
                     raise NotImplementedError()
@@ -834,8 +1086,16 @@ class Session(ISession):
         :param timeout:
         :return:
         """
-        await self._ensure_connection()
-        return await self._conn.copy_records_to_table(table_name, records=records, columns=columns, schema_name=schema_name, timeout=timeout)
+        try:
+            await self._locker.acquire()
+            await self._ensure_connection(False)
+            await self._ensure_transaction(False)
+            return await self._conn.copy_records_to_table(table_name, records=records, columns=columns, schema_name=schema_name, timeout=timeout)
+        except Exception:
+            await self.rollback(False)
+            raise
+        finally:
+            self._locker.release()
 
     async def commit(self):
         async with self._locker:
@@ -44,12 +44,13 @@ class PostgresConnection:
         connection_type: ConnectionType = ConnectionType.DEFAULT,
         command_timeout: int | None = None,
         loop=None,
+        statement_cache_size: int | None = None,
     ):
         match connection_type:
             case ConnectionType.POOL:
-                return await self._create_pool(command_timeout=command_timeout)
+                return await self._create_pool(command_timeout=command_timeout, statement_cache_size=statement_cache_size)
             case ConnectionType.DEFAULT:
-                return await self._create_connection(command_timeout=command_timeout, loop=loop)
+                return await self._create_connection(command_timeout=command_timeout, loop=loop, statement_cache_size=statement_cache_size)
             case _:
                 raise TypeError(
                     f'Failed to create connection, invalid database key "{connection_type}", '
@@ -59,9 +60,10 @@ class PostgresConnection:
     async def _create_pool(
         self,
         connection_type: ConnectionType = ConnectionType.POOL,
-        command_timeout: int | None = None
+        command_timeout: int | None = None,
+        statement_cache_size: int | None = None,
     ) -> asyncpg.pool.Pool:
-        """Create a connection pool"""
+        """Create a connection pool, the pool is shared so statement_cache_size only applies when it is first created"""
         context = self._get_context(connection_type)
         if not context:
             context = self._setup(
@@ -84,6 +86,8 @@ class PostgresConnection:
             server_settings = await self._create_server_settings(context)
             if command_timeout:
                 context.connect_kwargs['command_timeout'] = command_timeout
+            if statement_cache_size is not None:
+                context.connect_kwargs['statement_cache_size'] = statement_cache_size
 
             context.pool = await asyncpg.create_pool(
                 server_settings=server_settings,
@@ -97,6 +101,7 @@ class PostgresConnection:
         connection_type: ConnectionType = ConnectionType.DEFAULT,
         command_timeout: int | None = None,
         loop=None,
+        statement_cache_size: int | None = None,
     ) -> asyncpg.Connection:
         """Create a single connection"""
         context = self._get_context(connection_type)
@@ -118,6 +123,8 @@ class PostgresConnection:
         server_settings = await self._create_server_settings(context)
         if command_timeout:
             context.connect_kwargs['command_timeout'] = command_timeout
+        if statement_cache_size is not None:
+            context.connect_kwargs['statement_cache_size'] = statement_cache_size
 
         return await asyncpg.connect(
             server_settings=server_settings,
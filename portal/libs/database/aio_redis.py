@@ -11,20 +11,21 @@ class RedisPool:
 
     def __init__(self):
         self._uri = settings.REDIS_URL
-        self._redis = None
+        # One client (and so one connection pool) per db, shared by every handler
+        self._clients: dict[int, Redis] = {}
 
     def create(self, db: int = 0) -> Redis:
         """
 
         :return:
         """
-        if self._redis:
-            return self._redis
+        if client := self._clients.get(db):
+            return client
         session = from_url(
             url=self._uri,
             db=db,
             encoding="utf-8",
             decode_responses=True
         )
-        self._redis = session
+        self._clients[db] = session
         return session
@@ -10,11 +10,10 @@ from unittest.mock import MagicMock
 
 import sqlalchemy as sa
 from pydantic import BaseModel
-from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql.dml import Insert as PgInsert
 
 from portal.libs.database import Session
-from portal.libs.database.aio_orm import TableTypes, _Delete, _Insert, _Select, _Update
+from portal.libs.database.aio_orm import TableTypes, _Delete, _Insert, _Select, _Update, dialect
 
 
 def md5_encrypt(text: str, salt: str = ''):
@@ -64,6 +63,11 @@ class SelectMock(_Select):
         self._session.set_mock(self._select.statement, mock)
         return mock
 
+    async def fetchpages(self, no_order_by: bool = True, as_model: type[BaseModel] | None = None):
+        """Resolved from the mock_fetchpages mock, the windowed count query is never built"""
+        # noinspection PyUnresolvedReferences
+        return await self._session.fetchpages(self._select.statement, as_model=as_model)
+
     def mock_fetchdict(self, key: str, value: str | None = None, return_value: Any = None) -> MagicMock:
         """Mock the fetchdict method"""
         mock = MagicMock(return_value=return_value)
@@ -146,7 +150,7 @@ class SessionMock(Session):
         if isinstance(statement, str):
             strs = [statement]
         else:
-            compiled_statement = statement.compile(dialect=postgresql.dialect())
+            compiled_statement = statement.compile(dialect=dialect)
             strs = [str(compiled_statement)]
             if compiled_statement.params:
                 strs.append(json.dumps(compiled_statement.params, cls=DateEncoder))
@@ -228,7 +232,9 @@ class SessionMock(Session):
             return MagicMock(return_value=None)()
         return mock()
 
-    async def fetchgroup(self, statement, *params, timeout: float | None = None, groupby: str | None = None, as_model: type[BaseModel] | None = None):
+    async def fetchgroup(
+        self, statement, *params, timeout: float | None = None, groupby: str | None = None, as_model: type[BaseModel] | None = None
+    ):
         key, output_params = self._to_key(statement, params)
         mock: MagicMock | None = self._statement_mocks.get(key, None)
         if not mock:
@@ -7,15 +7,8 @@ from typing import TYPE_CHECKING
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from portal.libs.contexts.request_context import (
-    RequestContext,
-    reset_request_context,
-    set_request_context,
-)
-from portal.libs.contexts.request_session_context import (
-    reset_request_session,
-    set_request_session,
-)
+from portal.libs.contexts.request_context import RequestContext, set_request_context
+from portal.libs.contexts.request_session_context import set_request_session
 
 if TYPE_CHECKING:
     from portal.container import Container
@@ -33,13 +26,14 @@ def _resolve_ip(request: Request) -> str | None:
 
 class CoreRequestMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        req_ctx_token = None
         container: Container = request.app.container
         db_session = container.db_session()
-        session_ctx_token = set_request_session(db_session)
+        # The ASGI server runs every request in its own task, which starts from a copy of the
+        # context, so neither the session nor the request context can leak into other requests
+        set_request_session(db_session)
         try:
             # initialize request context
-            req_ctx_token = set_request_context(
+            set_request_context(
                 RequestContext(
                     ip=_resolve_ip(request),
                     client_ip=(request.client.host if request.client else None),
@@ -59,8 +53,5 @@ class CoreRequestMiddleware(BaseHTTPMiddleware):
             await db_session.commit()
             return response
         finally:
-            if req_ctx_token is not None:
-                reset_request_context(req_ctx_token)
             await db_session.close()
-            reset_request_session(session_ctx_token)
 
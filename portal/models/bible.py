@@ -77,5 +77,7 @@ class BibleVerse(ModelBase, AuditCreatedAtMixin, AuditUpdatedAtMixin):
     __table_args__ = (
         UniqueConstraint("book_id", "passage_id", name="uq_bible_verses_book_passage"),
         UniqueConstraint("book_id", "chapter", "verse", name="uq_bible_verses_book_chapter_verse"),
+        # Trigram index (pg_trgm) so the unanchored ILIKE of verse search can use an index
+        sa.Index("ix_bible_verses_content_trgm", "content", postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"}),
         {"comment": "Bible verses table - verse belongs to a book (which belongs to a version)"},
     )
@@ -105,7 +105,8 @@ async def search_bible_verses(
     bible_version_id: Annotated[UUID | None, Query(description="Bible version ID filter (UUID)")] = None,
     book_id: Annotated[UUID | None, Query(description="Book ID filter (UUID)")] = None,
     limit: Annotated[int, Query(description="Result limit", ge=1, le=100)] = 20,
-    offset: Annotated[int, Query(description="Result offset", ge=0)] = 0,
+    offset: Annotated[int, Query(description="Result offset, ignored when cursor is given", ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="next_cursor of the previous page")] = None,
     bible_handler: BibleHandler = Depends(Provide[Container.bible_handler]),
 ) -> BibleSearchResponse:
     """
@@ -115,6 +116,7 @@ async def search_bible_verses(
     :param book_id: Optional book ID filter (UUID)
     :param limit: Result limit
     :param offset: Result offset
+    :param cursor: Keyset cursor of the next page
     :param bible_handler:
     :return:
     """
@@ -124,5 +126,6 @@ async def search_bible_verses(
         book_id=book_id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
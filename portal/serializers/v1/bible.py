@@ -100,6 +100,8 @@ class BibleSearchResult(BaseModel):
     verse: int = Field(..., description="Verse number")
     content: str = Field(..., description="Verse content")
     highlight: str | None = Field(None, description="Highlighted search keyword")
+    # Only needed to build the next page cursor
+    book_sequence: float | None = Field(None, exclude=True)
 
     @field_serializer("bible_version_id", "book_id")
     def serialize_uuid(self, value: UUID, _info) -> str:
@@ -115,4 +117,5 @@ class BibleSearchResponse(BaseModel):
     total: int = Field(..., description="Total number of results")
     limit: int = Field(..., description="Result limit")
     offset: int = Field(..., description="Result offset")
+    next_cursor: str | None = Field(None, description="Cursor of the next page, None on the last page")
 
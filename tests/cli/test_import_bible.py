@@ -0,0 +1,15 @@
+"""
+Tests for the Bible import CLI
+"""
+from portal.cli.import_bible import VALUES_ROWS_PER_STATEMENT, VERSE_COLUMNS, _verse_values_sql
+
+
+def test_values_statement_fits_asyncpg_argument_limit():
+    assert VALUES_ROWS_PER_STATEMENT * len(VERSE_COLUMNS) <= 32767
+
+
+def test_values_sql_binds_every_column_of_every_row():
+    sql = _verse_values_sql(VALUES_ROWS_PER_STATEMENT)
+    last = VALUES_ROWS_PER_STATEMENT * len(VERSE_COLUMNS)
+    assert f"${last})" in sql
+    assert f"${last + 1}" not in sql
@@ -0,0 +1,34 @@
+"""
+Tests for the result formatting of aio_orm
+"""
+from datetime import date
+
+from portal.libs.database.aio_orm import _column_formatter, _format_records
+
+
+def test_format_records_keeps_null_after_list_in_first_row():
+    rows = [
+        {"id": 1, "tags": [date(2024, 1, 2)]},
+        {"id": 2, "tags": None},
+    ]
+    assert _format_records(rows) == [
+        {"id": 1, "tags": ["2024-01-02"]},
+        {"id": 2, "tags": None},
+    ]
+
+
+def test_format_records_converts_list_after_null_in_first_row():
+    rows = [
+        {"id": 1, "tags": None},
+        {"id": 2, "tags": [date(2024, 1, 2)]},
+    ]
+    assert _format_records(rows) == [
+        {"id": 1, "tags": None},
+        {"id": 2, "tags": ["2024-01-02"]},
+    ]
+
+
+def test_column_formatter_keeps_null_after_list_in_first_value():
+    values = [[date(2024, 1, 2)], None]
+    formatter = _column_formatter(values[0])
+    assert list(map(formatter, values)) == [["2024-01-02"], None]